@@ -14,6 +14,23 @@ from models.check_result import CheckResult
 # Distribución esperada de Benford
 BENFORD_EXPECTED = {d: np.log10(1 + 1/d) for d in range(1, 10)}
 
+# Decimales de la mantisa: mismo redondeo que f"{x:.10e}"
+MANTISSA_DECIMALS = 10
+
+
+def _first_digits(values: np.ndarray) -> np.ndarray:
+    """Primer dígito significativo de cada valor (> 0, finito), vectorizado.
+
+    Equivale a int(f"{x:.10e}"[0]): mantisa = x / 10**floor(log10(x)) redondeada a 10
+    decimales, corrigiendo el error de log10 en potencias de 10 (mantisa < 1 o = 10).
+    """
+    x = values[np.isfinite(values) & (values > 0)]
+    mantissa = x / np.power(10.0, np.floor(np.log10(x)))
+    mantissa = np.where(mantissa < 1, mantissa * 10, mantissa)
+    mantissa = np.round(mantissa, MANTISSA_DECIMALS)
+    mantissa = np.where(mantissa >= 10, mantissa / 10, mantissa)
+    return mantissa.astype(np.int64)
+
 
 def check_benford_law(series_raw: pd.Series, series_typed: pd.Series, metadata: dict) -> CheckResult:
     """BENFORD_LAW: test Chi² de la distribución de primeros dígitos vs Benford."""
@@ -28,8 +45,8 @@ def check_benford_law(series_raw: pd.Series, series_typed: pd.Series, metadata:
         )
 
     # Extraer primer dígito significativo
-    first_digits = s.abs().apply(lambda x: int(str(f"{x:.10e}")[0]) if x != 0 else 0)
-    first_digits = first_digits[first_digits.between(1, 9)]
+    first_digits = _first_digits(s.abs().to_numpy(dtype=np.float64))
+    first_digits = first_digits[(first_digits >= 1) & (first_digits <= 9)]
 
     if len(first_digits) < 100:
         return CheckResult(
@@ -39,12 +56,11 @@ def check_benford_law(series_raw: pd.Series, series_typed: pd.Series, metadata:
         )
 
     # Contar frecuencias observadas
-    observed_counts = first_digits.value_counts().reindex(range(1, 10), fill_value=0)
+    observed = np.bincount(first_digits, minlength=10)[1:10].astype(float)
     n = len(first_digits)
 
     # Frecuencias esperadas (Benford)
     expected_counts = np.array([BENFORD_EXPECTED[d] * n for d in range(1, 10)])
-    observed = observed_counts.values.astype(float)
 
     # Chi-squared test
     chi2, p_value = stats.chisquare(observed, expected_counts)
@@ -11,6 +11,9 @@ THRESHOLDS_SKEWNESS = {"HIGH": 3.0, "MEDIUM": 2.0, "LOW": 1.0}
 THRESHOLDS_ZERO = {"HIGH": 0.30, "MEDIUM": 0.10}
 THRESHOLDS_TREND = {"CRITICAL": 3.0, "HIGH": 2.5, "MEDIUM": 2.0}
 
+# Elementos por tramo en numeric_block_summary (64K float64 = 512 KB, cabe en L2)
+SUMMARY_CHUNK = 1 << 16
+
 
 def _severity_from_thresholds(value, thresholds):
     for sev in ("CRITICAL", "HIGH", "MEDIUM", "LOW"):
@@ -25,6 +28,42 @@ def _numeric_series(series_typed: pd.Series) -> pd.Series:
     return s
 
 
+def _numeric_block_columns(df: pd.DataFrame) -> list:
+    """Columnas del bloque con dtype numérico numpy (entero/float): no necesitan pd.to_numeric."""
+    return [c for c in df.columns if isinstance(df[c].dtype, np.dtype) and df[c].dtype.kind in "iuf"]
+
+
+def _column_counts(values: np.ndarray):
+    """(nulos, ceros, negativos) de un array numérico recorriéndolo por tramos de SUMMARY_CHUNK.
+
+    Cada tramo cabe en caché: las tres comparaciones leen de L2 y no de memoria principal.
+    """
+    n_null = n_zero = n_neg = 0
+    is_float = values.dtype.kind == "f"
+    for start in range(0, len(values), SUMMARY_CHUNK):
+        chunk = values[start:start + SUMMARY_CHUNK]
+        if is_float:
+            n_null += int(np.count_nonzero(np.isnan(chunk)))
+        n_zero += int(np.count_nonzero(chunk == 0))
+        n_neg += int(np.count_nonzero(chunk < 0))
+    return n_null, n_zero, n_neg
+
+
+def numeric_block_summary(df: pd.DataFrame, metadata: dict) -> dict:
+    """{columna: (nulos, ceros, negativos)} de las columnas numéricas numpy del bloque.
+
+    Se calcula una vez por bloque y se guarda en metadata["_numeric_summary"] junto al propio
+    DataFrame: NULL_RATE, ZERO_VALUES y NEGATIVE_VALUES por bloque comparten la misma pasada,
+    y un metadata reutilizado con otro DataFrame recalcula en vez de devolver conteos ajenos.
+    """
+    cached = metadata.get("_numeric_summary")
+    if cached is not None and cached[0] is df:
+        return cached[1]
+    summary = {col: _column_counts(df[col].to_numpy()) for col in _numeric_block_columns(df)}
+    metadata["_numeric_summary"] = (df, summary)
+    return summary
+
+
 def check_outlier_iqr(series_raw: pd.Series, series_typed: pd.Series, metadata: dict) -> CheckResult:
     """OUTLIER_IQR: valores fuera de 1.5xIQR (Tukey)."""
     s = _numeric_series(series_typed)
@@ -198,8 +237,27 @@ def check_negative_values(series_raw: pd.Series, series_typed: pd.Series, metada
         )
 
     mask = s < 0
-    count = int(mask.sum())
-    pct = count / len(s)
+    return _negative_result(series_raw.name, s, mask, int(mask.sum()), len(s))
+
+
+def check_negative_values_batch(df_raw: pd.DataFrame, df: pd.DataFrame, metadata: dict) -> dict:
+    """NEGATIVE_VALUES por bloque, con los conteos de numeric_block_summary."""
+    results = {}
+    for col, (n_null, _, n_neg) in numeric_block_summary(df, metadata).items():
+        n_valid = len(df) - n_null
+        if n_valid > 0:
+            s = df[col]
+            mask = s < 0 if n_neg > 0 else None
+            results[col] = _negative_result(col, s, mask, n_neg, n_valid)
+    for col in df.columns:
+        if col not in results:
+            results[col] = check_negative_values(df_raw[col], df[col], metadata)
+    return results
+
+
+def _negative_result(column, s: pd.Series, mask: pd.Series, count: int, n: int) -> CheckResult:
+    """CheckResult de NEGATIVE_VALUES; mask solo se usa para las muestras (None si count == 0)."""
+    pct = count / n
 
     if count == 0:
         severity = "PASS"
@@ -208,10 +266,10 @@ def check_negative_values(series_raw: pd.Series, series_typed: pd.Series, metada
     else:
         severity = "INFO"
 
-    samples = s[mask].head(5).tolist()
+    samples = s[mask].head(5).tolist() if count > 0 else []
 
     return CheckResult(
-        check_id="NEGATIVE_VALUES", column=series_raw.name,
+        check_id="NEGATIVE_VALUES", column=column,
         passed=severity == "PASS", severity=severity,
         value=round(pct, 4), threshold=0.0,
         message=f"{count:,} valores negativos ({pct:.1%})",
@@ -228,14 +286,30 @@ def check_zero_values(series_raw: pd.Series, series_typed: pd.Series, metadata:
             severity="PASS", value=0.0, threshold=0.0, message="Sin datos numéricos",
         )
 
-    mask = s == 0
-    count = int(mask.sum())
-    pct = count / len(s)
+    return _zero_result(series_raw.name, int((s == 0).sum()), len(s))
+
+
+def check_zero_values_batch(df_raw: pd.DataFrame, df: pd.DataFrame, metadata: dict) -> dict:
+    """ZERO_VALUES por bloque, con los conteos de numeric_block_summary."""
+    results = {
+        col: _zero_result(col, n_zero, len(df) - n_null)
+        for col, (n_null, n_zero, _) in numeric_block_summary(df, metadata).items()
+        if len(df) > n_null
+    }
+    for col in df.columns:
+        if col not in results:
+            results[col] = check_zero_values(df_raw[col], df[col], metadata)
+    return results
+
+
+def _zero_result(column, count: int, n: int) -> CheckResult:
+    """CheckResult de ZERO_VALUES a partir de los conteos de la columna."""
+    pct = count / n
 
     severity = _severity_from_thresholds(pct, THRESHOLDS_ZERO)
 
     return CheckResult(
-        check_id="ZERO_VALUES", column=series_raw.name,
+        check_id="ZERO_VALUES", column=column,
         passed=severity == "PASS", severity=severity,
         value=round(pct, 4), threshold=THRESHOLDS_ZERO.get(severity, 0.0),
         message=f"{count:,} valores cero ({pct:.1%})",
@@ -395,8 +469,9 @@ NUMERIC_CHECKS = [
     {"check_id": "OUTLIER_MODIFIED_Z", "function": check_outlier_modified_z},
     {"check_id": "DISTRIBUTION_SKEW", "function": check_distribution_skew},
     {"check_id": "DISTRIBUTION_KURTOSIS", "function": check_distribution_kurtosis},
-    {"check_id": "NEGATIVE_VALUES", "function": check_negative_values},
-    {"check_id": "ZERO_VALUES", "function": check_zero_values},
+    {"check_id": "NEGATIVE_VALUES", "function": check_negative_values,
+     "batch_function": check_negative_values_batch},
+    {"check_id": "ZERO_VALUES", "function": check_zero_values, "batch_function": check_zero_values_batch},
     {"check_id": "TREND_CHANGE", "function": check_trend_change},
     {"check_id": "VALUE_RANGE", "function": check_value_range},
     {"check_id": "VARIANCE_SUDDEN_CHANGE", "function": check_variance_sudden_change},
@@ -11,14 +11,21 @@ import numpy as np
 from models.check_result import CheckResult
 from models.semantic_type import SemanticType
 
+# Alias de resample → frecuencia de Period equivalente
+PERIOD_FREQ = {"ME": "M", "W": "W", "D": "D"}
+
 
 def run_temporal_completeness_checks(
     df: pd.DataFrame,
     df_raw: pd.DataFrame,
     column_types: Dict[str, SemanticType],
     date_col: Optional[str] = None,
+    dt_cache: Optional[Dict[str, pd.Series]] = None,
 ) -> List[CheckResult]:
-    """Analiza completitud de datos por periodo temporal."""
+    """Analiza completitud de datos por periodo temporal.
+
+    dt_cache: dict opcional {columna: serie datetime ya parseada} para no re-parsear.
+    """
     results = []
 
     # Encontrar columna de fecha
@@ -32,18 +39,14 @@ def run_temporal_completeness_checks(
     if not dt_col or dt_col not in df.columns:
         return results
 
-    dt = pd.to_datetime(df[dt_col], errors="coerce")
+    dt = dt_cache.get(dt_col) if dt_cache else None
+    if dt is None:
+        dt = pd.to_datetime(df[dt_col], errors="coerce")
     valid_mask = dt.notna()
     if valid_mask.sum() < 10:
         return results
 
-    # Crear un DataFrame con la fecha como índice
-    df_with_date = df.copy()
-    df_with_date["__date__"] = dt
-    df_with_date = df_with_date[valid_mask]
-
-    if len(df_with_date) < 10:
-        return results
+    dt_valid = dt[valid_mask]
 
     # Determinar frecuencia óptima
     date_range = (dt.max() - dt.min()).days
@@ -67,18 +70,23 @@ def run_temporal_completeness_checks(
     if not all_cols:
         return results
 
-    # Calcular tasa de nulos global por periodo
-    df_with_date = df_with_date.set_index("__date__")
+    # Matriz de nulos uint8 [filas válidas, columnas] + código de periodo por fila
+    valid_df = df.loc[valid_mask.to_numpy(), all_cols]
+    null_mat = _null_matrix(valid_df)
+    codes, period_labels = _period_codes(dt_valid, freq)
+    n_periods = len(period_labels)
 
-    try:
-        period_null_rates = df_with_date[all_cols].resample(freq).apply(
-            lambda x: x.isna().mean().mean()  # promedio de tasa nulos de todas las cols
-        )
-    except Exception:
+    if n_periods < 3:
         return results
 
-    if len(period_null_rates) < 3:
-        return results
+    # Tasa de nulos global por periodo: nulos del periodo / (filas del periodo × columnas)
+    rows_per_period = np.bincount(codes, minlength=n_periods)
+    nulls_per_row = null_mat.sum(axis=1, dtype=np.int64)
+    nulls_per_period = np.bincount(codes, weights=nulls_per_row, minlength=n_periods)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        period_null_rates = pd.Series(
+            nulls_per_period / (rows_per_period * len(all_cols)), index=period_labels,
+        )
 
     # Detectar periodos con degradación (null rate > 2x el promedio)
     avg_null_rate = period_null_rates.mean()
@@ -111,39 +119,63 @@ def run_temporal_completeness_checks(
             ))
 
     # Análisis por columna: detectar columnas con nulidad concentrada temporalmente
-    for col in all_cols[:20]:  # limitar a 20 columnas
-        col_null_pct = float(df[col].isna().mean())
-        if col_null_pct < 0.01 or col_null_pct > 0.95:
-            continue
-
-        try:
-            col_null_by_period = df_with_date[col].resample(freq).apply(
-                lambda x: x.isna().mean()
-            )
-        except Exception:
-            continue
-
-        if len(col_null_by_period) < 3:
-            continue
-
-        # Detectar si los nulos están concentrados en pocos periodos
-        high_null_periods = col_null_by_period[col_null_by_period > col_null_pct * 3]
-        if len(high_null_periods) > 0 and len(high_null_periods) <= len(col_null_by_period) * 0.3:
-            results.append(CheckResult(
-                check_id="TEMPORAL_NULL_CONCENTRATION",
-                column=col,
-                passed=False,
-                severity="MEDIUM",
-                value=round(float(high_null_periods.max()), 4),
-                threshold=round(col_null_pct * 3, 4),
-                message=f"Nulos concentrados temporalmente: {len(high_null_periods)} {freq_label}(s) "
-                        f"con >3x la tasa promedio de nulos ({col_null_pct:.1%})",
-                affected_count=len(high_null_periods),
-                affected_pct=len(high_null_periods) / len(col_null_by_period),
-                metadata={
-                    "high_null_periods": [str(d)[:10] for d in high_null_periods.index[:5]],
-                    "avg_null_rate": round(col_null_pct, 4),
-                },
-            ))
+    # bincount ponderado por columna (loop C vectorizado) en lugar de resample por columna
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for j, col in enumerate(all_cols[:20]):  # limitar a 20 columnas
+            col_nulls = np.bincount(codes, weights=null_mat[:, j], minlength=n_periods)
+            col_null_by_period = pd.Series(col_nulls / rows_per_period, index=period_labels)
+            result = _null_concentration_check(df, col, col_null_by_period, freq_label)
+            if result is not None:
+                results.append(result)
 
     return results
+
+
+def _null_matrix(df: pd.DataFrame) -> np.ndarray:
+    """Matriz de nulos uint8 (1 byte/celda), llenada por columna sin DataFrame booleano intermedio."""
+    null_mat = np.empty((len(df), df.shape[1]), dtype=np.uint8, order="F")
+    for j in range(df.shape[1]):
+        null_mat[:, j] = df.iloc[:, j].isna().to_numpy()
+    return null_mat
+
+
+def _period_codes(dt_valid: pd.Series, freq: str):
+    """Código 0..n_periods-1 por fila y etiquetas de periodo (mismos bins que resample(freq)).
+
+    Incluye los periodos intermedios sin filas, igual que resample.
+    """
+    periods = pd.PeriodIndex(dt_valid.dt.to_period(PERIOD_FREQ[freq]))
+    ordinals = periods.asi8
+    first = int(ordinals.min())
+    codes = (ordinals - first).astype(np.intp)
+    labels = pd.period_range(start=periods.min(), periods=int(codes.max()) + 1, freq=periods.freq)
+    return codes, labels.to_timestamp(how="end").normalize()
+
+
+def _null_concentration_check(df, col, col_null_by_period, freq_label) -> Optional[CheckResult]:
+    """TEMPORAL_NULL_CONCENTRATION para una columna; None si no aplica."""
+    col_null_pct = float(df[col].isna().mean())
+    if col_null_pct < 0.01 or col_null_pct > 0.95:
+        return None
+
+    # Detectar si los nulos están concentrados en pocos periodos
+    high_null_periods = col_null_by_period[col_null_by_period > col_null_pct * 3]
+    if len(high_null_periods) == 0 or len(high_null_periods) > len(col_null_by_period) * 0.3:
+        return None
+
+    return CheckResult(
+        check_id="TEMPORAL_NULL_CONCENTRATION",
+        column=col,
+        passed=False,
+        severity="MEDIUM",
+        value=round(float(high_null_periods.max()), 4),
+        threshold=round(col_null_pct * 3, 4),
+        message=f"Nulos concentrados temporalmente: {len(high_null_periods)} {freq_label}(s) "
+                f"con >3x la tasa promedio de nulos ({col_null_pct:.1%})",
+        affected_count=len(high_null_periods),
+        affected_pct=len(high_null_periods) / len(col_null_by_period),
+        metadata={
+            "high_null_periods": [str(d)[:10] for d in high_null_periods.index[:5]],
+            "avg_null_rate": round(col_null_pct, 4),
+        },
+    )
@@ -1,12 +1,15 @@
 import re
-import numpy as np
 import pandas as pd
 
 from models.check_result import CheckResult
+from utils.unique_values import UniqueValues, apply_via_categories
 
 
 EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$")
 PHONE_RE = re.compile(r"^[\+]?[\d\s\-\.\(\)]{7,20}$")
+# Solo mira el final del string: basta con evaluar una cola acotada
+TRUNC_ABRUPT_RE = re.compile(r"[a-záéíóúñ]{2,}$", re.IGNORECASE)
+TRUNC_TAIL_LEN = 6
 
 NULL_LIKE = {
     "", "null", "none", "nan", "na", "n/a", "n.a.", "-", "--", "---",
@@ -15,10 +18,18 @@ NULL_LIKE = {
 }
 
 
+def _is_null_like(s: pd.Series) -> pd.Series:
+    # Con pandas >= 3, astype(str) conserva NaN en vez de producir "nan"
+    return s.isna() | s.str.lower().isin(NULL_LIKE)
+
+
 def check_email_format(series_raw: pd.Series, series_typed: pd.Series, metadata: dict) -> CheckResult:
     """EMAIL_FORMAT: emails que no cumplen RFC 5322 básico."""
     non_empty = series_raw.astype(str).str.strip()
-    non_empty = non_empty[(non_empty != "") & (~non_empty.str.lower().isin(NULL_LIKE))]
+    # Una sola factorización para el filtro null-like y el regex
+    values = UniqueValues(non_empty)
+    keep = (non_empty != "") & (~values.apply(_is_null_like))
+    non_empty, values = non_empty[keep], values.subset(keep)
 
     if len(non_empty) == 0:
         return CheckResult(
@@ -26,7 +37,7 @@ def check_email_format(series_raw: pd.Series, series_typed: pd.Series, metadata:
             severity="PASS", value=0.0, threshold=0.0, message="Sin datos",
         )
 
-    invalid_mask = ~non_empty.apply(lambda x: bool(EMAIL_RE.match(x)))
+    invalid_mask = ~values.apply(lambda s: s.str.match(EMAIL_RE))
     count = int(invalid_mask.sum())
     pct = count / len(non_empty)
 
@@ -53,7 +64,10 @@ def check_email_format(series_raw: pd.Series, series_typed: pd.Series, metadata:
 def check_phone_format(series_raw: pd.Series, series_typed: pd.Series, metadata: dict) -> CheckResult:
     """PHONE_FORMAT: teléfonos que no cumplen patrón esperado."""
     non_empty = series_raw.astype(str).str.strip()
-    non_empty = non_empty[(non_empty != "") & (~non_empty.str.lower().isin(NULL_LIKE))]
+    # Una sola factorización para el filtro null-like y el regex
+    values = UniqueValues(non_empty)
+    keep = (non_empty != "") & (~values.apply(_is_null_like))
+    non_empty, values = non_empty[keep], values.subset(keep)
 
     if len(non_empty) == 0:
         return CheckResult(
@@ -61,7 +75,7 @@ def check_phone_format(series_raw: pd.Series, series_typed: pd.Series, metadata:
             severity="PASS", value=0.0, threshold=0.0, message="Sin datos",
         )
 
-    invalid_mask = ~non_empty.apply(lambda x: bool(PHONE_RE.match(x)))
+    invalid_mask = ~values.apply(lambda s: s.str.match(PHONE_RE))
     count = int(invalid_mask.sum())
     pct = count / len(non_empty)
 
@@ -96,7 +110,7 @@ def check_length_outliers(series_raw: pd.Series, series_typed: pd.Series, metada
             severity="PASS", value=0.0, threshold=0.0, message="Datos insuficientes",
         )
 
-    lengths = non_empty.str.len()
+    lengths = apply_via_categories(non_empty, lambda s: s.str.len())
     q1, q3 = lengths.quantile(0.25), lengths.quantile(0.75)
     iqr = q3 - q1
 
@@ -144,7 +158,7 @@ def check_null_like_strings(series_raw: pd.Series, series_typed: pd.Series, meta
             severity="PASS", value=0.0, threshold=0.0, message="Sin datos",
         )
 
-    null_like_mask = non_empty.str.lower().isin(NULL_LIKE - {""})
+    null_like_mask = apply_via_categories(non_empty, _is_null_like)
     count = int(null_like_mask.sum())
     pct = count / len(non_empty)
 
@@ -171,7 +185,11 @@ def check_null_like_strings(series_raw: pd.Series, series_typed: pd.Series, meta
 def check_truncation_signs(series_raw: pd.Series, series_typed: pd.Series, metadata: dict) -> CheckResult:
     """TRUNCATION_SIGNS: valores que terminan abruptamente (posible truncación)."""
     non_empty = series_raw.astype(str).str.strip()
-    non_empty = non_empty[(non_empty != "") & (non_empty.str.len() > 5)]
+    # Una sola factorización (y un solo cálculo de longitudes) para las tres señales
+    values = UniqueValues(non_empty)
+    lengths = values.apply(lambda s: s.str.len())
+    keep = lengths > 5
+    non_empty, lengths, values = non_empty[keep], lengths[keep], values.subset(keep)
 
     if len(non_empty) < 10:
         return CheckResult(
@@ -180,10 +198,11 @@ def check_truncation_signs(series_raw: pd.Series, series_typed: pd.Series, metad
         )
 
     # Señales de truncación: terminan en "...", se cortan a longitud fija, terminan en medio de palabra
-    max_len = non_empty.str.len().max()
-    at_max = non_empty.str.len() == max_len
-    ends_ellipsis = non_empty.str.endswith("...")
-    ends_abrupt = non_empty.str.match(r".*[a-záéíóúñ]{2,}$", case=False) & at_max
+    at_max = lengths == lengths.max()
+    ends_ellipsis = values.apply(lambda s: s.str.endswith("..."))
+    ends_abrupt = values.apply(
+        lambda s: s.str.slice(-TRUNC_TAIL_LEN).str.contains(TRUNC_ABRUPT_RE)
+    ) & at_max
 
     truncated = ends_ellipsis | ends_abrupt
     count = int(truncated.sum())
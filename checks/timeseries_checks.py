@@ -8,7 +8,7 @@ import logging
 
 import numpy as np
 import pandas as pd
-from scipy import stats
+from scipy import fft as sp_fft
 
 from models.check_result import CheckResult
 from models.semantic_type import SemanticType
@@ -16,8 +16,11 @@ from models.semantic_type import SemanticType
 logger = logging.getLogger(__name__)
 
 
-def run_timeseries_checks(df, df_raw, column_types, date_col=None):
-    """Ejecuta checks de series temporales. Retorna lista de CheckResult."""
+def run_timeseries_checks(df, df_raw, column_types, date_col=None, dt_cache=None):
+    """Ejecuta checks de series temporales. Retorna lista de CheckResult.
+
+    dt_cache: dict opcional {columna: serie datetime ya parseada} para no re-parsear.
+    """
     results = []
 
     # Encontrar columna de fecha
@@ -29,7 +32,9 @@ def run_timeseries_checks(df, df_raw, column_types, date_col=None):
     if dt_col is None:
         return results
 
-    dt = pd.to_datetime(df[dt_col], errors="coerce")
+    dt = dt_cache.get(dt_col) if dt_cache else None
+    if dt is None:
+        dt = pd.to_datetime(df[dt_col], errors="coerce")
     if dt.dropna().empty:
         return results
 
@@ -37,20 +42,86 @@ def run_timeseries_checks(df, df_raw, column_types, date_col=None):
     num_cols = [c for c, t in column_types.items()
                 if t in (SemanticType.NUMERIC_CONTINUOUS, SemanticType.NUMERIC_DISCRETE)
                 and c in df.columns]
+    if not num_cols:
+        return results
+
+    # Columnas sin nulos en las filas con fecha válida comparten el mismo orden
+    # temporal → se apilan en una matriz y ACF/CUSUM se calculan en lote.
+    valid_mask = dt.notna().to_numpy()
+    dt_valid = dt[valid_mask]
+    num_df = df[num_cols][valid_mask].apply(pd.to_numeric, errors="coerce")
+    dense_flags = num_df.notna().all().tolist()
+    dense_cols = [c for c, dense in zip(num_cols, dense_flags) if dense]
+    sparse_cols = [c for c, dense in zip(num_cols, dense_flags) if not dense]
+
+    col_results = {}
+    if dense_cols and len(dt_valid) >= 20:
+        # Mismo orden entre fechas repetidas que sort_values("dt") del camino por columna
+        order = np.argsort(dt_valid.to_numpy())
+        dates = dt_valid.iloc[order]
+        M = num_df[dense_cols].to_numpy(dtype=np.float64)[order]
+        batch = _batched_stats(M)
+        for j, col in enumerate(dense_cols):
+            col_results[col] = _dense_column_checks(M, j, batch, dates, col)
+    else:
+        sparse_cols = num_cols
+
+    for col in sparse_cols:
+        col_results[col] = _column_timeseries_checks(df, dt, col)
 
+    # Mantener el orden original de columnas
     for col in num_cols:
-        s = pd.to_numeric(df[col], errors="coerce")
-        valid = pd.DataFrame({"dt": dt, "val": s}).dropna().sort_values("dt")
-        if len(valid) < 20:
-            continue
+        results.extend(col_results.get(col, []))
+
+    return results
 
-        results.extend(_autocorrelation_check(valid["val"], col))
-        results.extend(_seasonality_check(valid["val"], valid["dt"], col))
-        results.extend(_changepoint_cusum(valid["val"], col))
 
+def _column_timeseries_checks(df, dt, col):
+    """Checks temporales de una sola columna numérica alineada con la fecha."""
+    s = pd.to_numeric(df[col], errors="coerce")
+    valid = pd.DataFrame({"dt": dt, "val": s}).dropna().sort_values("dt")
+    if len(valid) < 20:
+        return []
+
+    results = []
+    results.extend(_autocorrelation_check(valid["val"], col))
+    results.extend(_seasonality_check(valid["val"], valid["dt"], col))
+    results.extend(_changepoint_cusum(valid["val"], col))
     return results
 
 
+def _dense_column_checks(M, j, batch, dates, col):
+    """Checks temporales de la columna j de la matriz apilada, usando estadísticos en lote."""
+    s = M[:, j]
+    results = []
+    if batch["acf"] is not None:
+        results.extend(_autocorrelation_result(batch["acf"][:, j], len(s), col))
+    results.extend(_seasonality_check(s, dates, col))
+    results.extend(_changepoint_result(s, batch["cusum"][:, j], batch["mean"][j], batch["std"][j], col))
+    return results
+
+
+def _batched_stats(M):
+    """Media, std, CUSUM y ACF de todas las columnas de M[n_rows, n_cols] en una sola pasada."""
+    n = M.shape[0]
+    mean = M.mean(axis=0)
+    std = M.std(axis=0)
+    cusum = np.cumsum(M - mean, axis=0)
+    acf = _batched_acf(M, min(20, n // 2 - 1)) if n >= 30 else None
+    return {"mean": mean, "std": std, "cusum": cusum, "acf": acf}
+
+
+def _batched_acf(M, nlags):
+    """ACF vía FFT por columnas (equivalente a statsmodels acf(fft=True, adjusted=False))."""
+    n = M.shape[0]
+    X = M - M.mean(axis=0)
+    nfft = sp_fft.next_fast_len(2 * n - 1)
+    F = np.fft.rfft(X, n=nfft, axis=0)
+    acov = np.fft.irfft(F * F.conj(), n=nfft, axis=0)[:nlags + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return acov / acov[0]
+
+
 def _find_date_column(df, column_types):
     for col, t in column_types.items():
         if t in (SemanticType.DATE, SemanticType.DATETIME):
@@ -63,26 +134,16 @@ def _find_date_column(df, column_types):
 # ---------------------------------------------------------------------------
 
 def _autocorrelation_check(series, col_name):
-    results = []
-    s = series.values
+    s = np.asarray(series, dtype=np.float64)
     n = len(s)
     if n < 30:
-        return results
+        return []
+    acf_values = _batched_acf(s[:, None], min(20, n // 2 - 1))[:, 0]
+    return _autocorrelation_result(acf_values, n, col_name)
 
-    try:
-        from statsmodels.tsa.stattools import acf
-        acf_values = acf(s, nlags=min(20, n // 2 - 1), fft=True)
-    except Exception:
-        # Fallback manual
-        mean = np.mean(s)
-        var = np.var(s)
-        if var == 0:
-            return results
-        acf_values = []
-        for lag in range(min(21, n // 2)):
-            c = np.mean((s[:n - lag] - mean) * (s[lag:] - mean)) / var if lag > 0 else 1.0
-            acf_values.append(c)
-        acf_values = np.array(acf_values)
+
+def _autocorrelation_result(acf_values, n, col_name):
+    results = []
 
     # Significancia: ±1.96/√n
     threshold = 1.96 / np.sqrt(n)
@@ -114,7 +175,7 @@ def _autocorrelation_check(series, col_name):
 
 def _seasonality_check(series, dates, col_name):
     results = []
-    s = series.values
+    s = np.asarray(series)
     n = len(s)
     if n < 24:
         return results
@@ -123,7 +184,7 @@ def _seasonality_check(series, dates, col_name):
     try:
         from statsmodels.tsa.seasonal import STL
         # Crear serie temporal indexada
-        ts = pd.Series(s, index=pd.DatetimeIndex(dates.values))
+        ts = pd.Series(s, index=pd.DatetimeIndex(np.asarray(dates)))
         ts = ts[~ts.index.duplicated(keep="first")]
         if len(ts) < 24:
             return results
@@ -201,19 +262,22 @@ def _detect_period(ts):
 # ---------------------------------------------------------------------------
 
 def _changepoint_cusum(series, col_name):
-    results = []
-    s = series.values
+    s = np.asarray(series, dtype=np.float64)
     n = len(s)
     if n < 30:
-        return results
+        return []
 
     mean = np.mean(s)
-    std = np.std(s)
-    if std == 0:
-        return results
-
     # CUSUM acumulado
     cusum = np.cumsum(s - mean)
+    return _changepoint_result(s, cusum, mean, np.std(s), col_name)
+
+
+def _changepoint_result(s, cusum, mean, std, col_name):
+    results = []
+    n = len(s)
+    if n < 30 or std == 0:
+        return results
 
     # Detectar punto de máxima desviación
     max_idx = np.argmax(np.abs(cusum))
@@ -223,7 +287,6 @@ def _changepoint_cusum(series, col_name):
     threshold = 2 * std * np.sqrt(n)
 
     if max_cusum > threshold:
-        # Calcular significancia con bootstrap
         changepoint_pct = max_idx / n
 
         if changepoint_pct < 0.1 or changepoint_pct > 0.9:
@@ -231,8 +294,10 @@ def _changepoint_cusum(series, col_name):
         else:
             severity = "MEDIUM"
 
-        mean_before = np.mean(s[:max_idx + 1]) if max_idx > 0 else mean
-        mean_after = np.mean(s[max_idx + 1:]) if max_idx < n - 1 else mean
+        # Medias antes/después desde la suma prefija: cusum[k] = sum(s[:k+1]) - mean·(k+1)
+        sum_before = mean * (max_idx + 1) + cusum[max_idx]
+        mean_before = sum_before / (max_idx + 1) if max_idx > 0 else mean
+        mean_after = (mean * n - sum_before) / (n - max_idx - 1) if max_idx < n - 1 else mean
 
         results.append(CheckResult(
             check_id="CHANGEPOINT_CUSUM", column=col_name,
@@ -2,6 +2,8 @@ import pandas as pd
 import numpy as np
 
 from models.check_result import CheckResult
+from models.semantic_type import SemanticType
+from checks.numeric_checks import numeric_block_summary
 
 
 NULL_LIKE = {
@@ -13,6 +15,15 @@ NULL_LIKE = {
 THRESHOLDS_NULL = {"CRITICAL": 0.50, "HIGH": 0.20, "MEDIUM": 0.05, "LOW": 0.01}
 THRESHOLDS_DUPLICATE = {"CRITICAL": 0.10, "HIGH": 0.05, "MEDIUM": 0.01}
 
+# Tipos cuya serie tipada ya tiene los null-like convertidos a NaN por pandas
+TYPED_NULL_TYPES = frozenset({
+    SemanticType.NUMERIC_CONTINUOUS, SemanticType.NUMERIC_DISCRETE,
+    SemanticType.DATE, SemanticType.DATETIME, SemanticType.BOOLEAN,
+})
+# dtype.kind de series tipadas que no pueden contener strings null-like (bool/int/float/datetime).
+# Las de texto (object o str de pandas >= 3) siempre pasan por el escaneo de strings.
+TYPED_NULL_KINDS = "biufM"
+
 
 def _severity_from_thresholds(value, thresholds):
     for sev in ("CRITICAL", "HIGH", "MEDIUM", "LOW"):
@@ -23,9 +34,39 @@ def _severity_from_thresholds(value, thresholds):
 
 def check_null_rate(series_raw: pd.Series, series_typed: pd.Series, metadata: dict) -> CheckResult:
     """NULL_RATE: % de nulos, NaN, y strings null-like."""
-    lower = series_raw.astype(str).str.strip().str.lower()
-    is_null = lower.isin(NULL_LIKE) | series_typed.isna()
-    null_count = int(is_null.sum())
+    if metadata.get("_semantic_type") in TYPED_NULL_TYPES and series_typed.dtype.kind in TYPED_NULL_KINDS:
+        # Fast path: una columna numérica/fecha/bool no puede contener strings null-like
+        is_null = series_typed.isna()
+    else:
+        lower = series_raw.astype(str).str.strip().str.lower()
+        is_null = lower.isin(NULL_LIKE) | series_typed.isna()
+    return _null_rate_result(series_raw, is_null, int(is_null.sum()))
+
+
+def check_null_rate_batch(df_raw: pd.DataFrame, df: pd.DataFrame, metadata: dict) -> dict:
+    """NULL_RATE por bloque para las columnas ya tipadas (dtype.kind en TYPED_NULL_KINDS).
+
+    Retorna {columna: CheckResult}; las columnas de texto se evalúan con check_null_rate.
+    """
+    results = {}
+    if metadata.get("_semantic_type") in TYPED_NULL_TYPES:
+        # Numéricas: conteo compartido con ZERO/NEGATIVE_VALUES; resto de tipadas: isna().sum()
+        null_counts = {col: counts[0] for col, counts in numeric_block_summary(df, metadata).items()}
+        other_cols = [c for c in df.columns
+                      if c not in null_counts and df[c].dtype.kind in TYPED_NULL_KINDS]
+        if other_cols:
+            null_counts.update(df[other_cols].isna().sum().items())
+        for col, null_count in null_counts.items():
+            is_null = df[col].isna() if null_count > 0 else None
+            results[col] = _null_rate_result(df_raw[col], is_null, int(null_count))
+    for col in df.columns:
+        if col not in results:
+            results[col] = check_null_rate(df_raw[col], df[col], metadata)
+    return results
+
+
+def _null_rate_result(series_raw: pd.Series, is_null, null_count: int) -> CheckResult:
+    """CheckResult de NULL_RATE; is_null solo se usa para las muestras (puede ser None si no hay nulos)."""
     n = len(series_raw)
     null_pct = null_count / n if n > 0 else 0.0
 
@@ -124,26 +165,43 @@ def check_constant_column(series_raw: pd.Series, series_typed: pd.Series, metada
     """CONSTANT_COLUMN: columna con un solo valor único."""
     non_null = series_typed.dropna()
     n_unique = non_null.nunique()
-    is_constant = n_unique <= 1 and len(non_null) > 0
+    unique_val = non_null.iloc[0] if n_unique == 1 else None
+    return _constant_result(series_raw.name, n_unique, len(non_null), unique_val)
+
+
+def check_constant_column_batch(df_raw: pd.DataFrame, df: pd.DataFrame, metadata: dict) -> dict:
+    """CONSTANT_COLUMN por bloque: nunique() y count() del bloque en una llamada cada uno."""
+    n_unique = df.nunique()
+    n_non_null = df.count()
+    results = {}
+    for col in df.columns:
+        # Primer valor no nulo = el único valor de una columna constante
+        unique_val = df[col].dropna().iloc[0] if n_unique[col] == 1 else None
+        results[col] = _constant_result(col, int(n_unique[col]), int(n_non_null[col]), unique_val)
+    return results
+
+
+def _constant_result(column, n_unique: int, n_non_null: int, unique_val) -> CheckResult:
+    """CheckResult de CONSTANT_COLUMN a partir de los conteos de la columna."""
+    is_constant = n_unique <= 1 and n_non_null > 0
 
     if is_constant:
-        unique_val = non_null.unique()[0] if len(non_null.unique()) > 0 else None
         return CheckResult(
             check_id="CONSTANT_COLUMN",
-            column=series_raw.name,
+            column=column,
             passed=False,
             severity="LOW",
             value=1.0,
             threshold=1.0,
             message=f"Columna constante: todos los valores son '{unique_val}'",
-            affected_count=len(non_null),
+            affected_count=n_non_null,
             affected_pct=1.0,
             sample_values=[str(unique_val)],
         )
 
     return CheckResult(
         check_id="CONSTANT_COLUMN",
-        column=series_raw.name,
+        column=column,
         passed=True,
         severity="PASS",
         value=float(n_unique),
@@ -166,9 +224,12 @@ def check_near_constant(series_raw: pd.Series, series_typed: pd.Series, metadata
             message="Columna vacía",
         )
 
-    value_counts = non_null.value_counts(normalize=True)
-    top_pct = float(value_counts.iloc[0])
-    top_val = value_counts.index[0]
+    # Solo se necesita la moda: factorize + bincount evita ordenar todos los únicos
+    codes, uniques = pd.factorize(non_null, sort=False)
+    counts = np.bincount(codes)
+    top_idx = int(counts.argmax())
+    top_pct = float(counts[top_idx] / len(non_null))
+    top_val = uniques[top_idx]
 
     if top_pct >= 0.95:
         return CheckResult(
@@ -196,9 +257,10 @@ def check_near_constant(series_raw: pd.Series, series_typed: pd.Series, metadata
 
 
 UNIVERSAL_CHECKS = [
-    {"check_id": "NULL_RATE", "function": check_null_rate},
+    {"check_id": "NULL_RATE", "function": check_null_rate, "batch_function": check_null_rate_batch},
     {"check_id": "DUPLICATE_ROWS", "function": check_duplicate_rows},
     {"check_id": "WHITESPACE_ISSUES", "function": check_whitespace_issues},
-    {"check_id": "CONSTANT_COLUMN", "function": check_constant_column},
+    {"check_id": "CONSTANT_COLUMN", "function": check_constant_column,
+     "batch_function": check_constant_column_batch},
     {"check_id": "NEAR_CONSTANT", "function": check_near_constant},
 ]
@@ -23,30 +23,72 @@ Formato YAML:
       severity: MEDIUM
 """
 
+import io
+import keyword
 import logging
 import re
+import tokenize
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
 import pandas as pd
 import numpy as np
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 
 from models.check_result import CheckResult
 
+try:
+    import numexpr  # noqa: F401
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
 logger = logging.getLogger(__name__)
 
 # ── Validación de expresiones para prevenir inyección de código ──
-# Solo se permiten: nombres de columnas, operadores de comparación, lógicos,
-# literales numéricos, literales de string entre comillas, paréntesis.
-_SAFE_EXPR_RE = re.compile(
-    r"^[\w\s\.\+\-\*/<>=!&|~(),'\"\d]+$"
-)
-
-# Tokens prohibidos que podrían usarse para inyección
-_FORBIDDEN_TOKENS = {
+# Se tokeniza la expresión una sola vez y solo se aceptan: nombres (columnas),
+# literales numéricos y de string simples, y una lista cerrada de operadores.
+_ALLOWED_OPS = frozenset({
+    "+", "-", "*", "/", "//", "**", "(", ")", ",",
+    "<", ">", "<=", ">=", "==", "!=", "&", "|", "~",
+})
+
+# Nombres prohibidos que podrían usarse para inyección
+_FORBIDDEN_NAMES = frozenset({
     "__import__", "exec", "eval", "compile", "globals", "locals",
-    "getattr", "setattr", "delattr", "__builtins__", "open", "os.",
-    "sys.", "subprocess", "import ", "lambda", "__class__", "__subclasses__",
-}
+    "getattr", "setattr", "delattr", "__builtins__", "open",
+    "subprocess", "import", "lambda", "__class__", "__subclasses__",
+})
+
+_IGNORED_TOKENS = frozenset({tokenize.NEWLINE, tokenize.NL, tokenize.ENDMARKER})
+
+
+@lru_cache(maxsize=2048)
+def _expression_error(expr: str) -> Optional[str]:
+    """Recorre los tokens de expr una vez; retorna el motivo de rechazo o None si es segura."""
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(expr).readline))
+    except (tokenize.TokenError, SyntaxError):
+        return f"no es una expresión válida: {expr!r}"
+
+    for tok in tokens:
+        if tok.type in _IGNORED_TOKENS:
+            continue
+        if tok.type == tokenize.NAME:
+            if tok.string.lower() in _FORBIDDEN_NAMES or tok.string.startswith("__"):
+                return f"contiene token prohibido: '{tok.string}'"
+        elif tok.type == tokenize.NUMBER:
+            continue
+        elif tok.type == tokenize.STRING:
+            # Solo literales '...' o "..." sin prefijos (f/b/r) ni escapes
+            if tok.string[0] not in "'\"" or "\\" in tok.string:
+                return f"contiene literal de string no permitido: {tok.string}"
+        elif tok.type == tokenize.OP:
+            if tok.string not in _ALLOWED_OPS:
+                return f"contiene operador no permitido: '{tok.string}'"
+        else:
+            return f"contiene caracteres no permitidos: {expr!r}"
+    return None
 
 
 def _validate_expression(expr: str, expr_type: str = "expression") -> None:
@@ -61,19 +103,68 @@ def _validate_expression(expr: str, expr_type: str = "expression") -> None:
     if len(stripped) > 500:
         raise ValueError(f"{expr_type} demasiado largo ({len(stripped)} chars, máximo 500)")
 
-    # Buscar tokens prohibidos (case-insensitive)
-    lower = stripped.lower()
-    for token in _FORBIDDEN_TOKENS:
-        if token in lower:
-            raise ValueError(
-                f"{expr_type} contiene token prohibido: '{token}'"
-            )
+    error = _expression_error(stripped)
+    if error:
+        raise ValueError(f"{expr_type} {error}")
 
-    # Verificar que solo contiene caracteres permitidos
-    if not _SAFE_EXPR_RE.match(stripped):
-        raise ValueError(
-            f"{expr_type} contiene caracteres no permitidos: {stripped!r}"
-        )
+
+# Motor de pd.eval: numexpr (multihilo, vectorizado) si está instalado; se elige una vez
+_EVAL_ENGINE = "numexpr" if HAS_NUMEXPR else "python"
+
+
+@lru_cache(maxsize=2048)
+def _referenced_names(expr: str) -> tuple:
+    """Nombres (candidatos a columna) que aparecen en la expresión, en orden y sin repetir."""
+    names = (tok.string for tok in tokenize.generate_tokens(io.StringIO(expr).readline)
+             if tok.type == tokenize.NAME and not keyword.iskeyword(tok.string))
+    return tuple(dict.fromkeys(names))
+
+
+# "col is not null" / "col is null" → máscaras de nulos para pd.eval
+_NULL_CHECK_RE = re.compile(r"\b(\w+)\s+is\s+(not\s+)?null\b", re.IGNORECASE)
+_AND_SPLIT_RE = re.compile(r"\s+and\s+", re.IGNORECASE)
+
+
+def _pandas_eval(df: pd.DataFrame, expression: str):
+    """pd.eval con motor explícito y solo las columnas referenciadas como scope.
+
+    "col is null" / "col is not null" (no son sintaxis de pd.eval) se precalculan como máscaras.
+    """
+    local_dict = {}
+
+    def _null_mask(match):
+        col, negated = match.group(1), match.group(2)
+        if col not in df.columns:
+            return match.group(0)
+        name = f"_null_check_{len(local_dict)}"
+        local_dict[name] = ~_isnull(df[col]) if negated else _isnull(df[col])
+        return name
+
+    expression = _NULL_CHECK_RE.sub(_null_mask, expression)
+    for name in _referenced_names(expression):
+        if name in df.columns:
+            local_dict[name] = df[name]
+    engine = _EVAL_ENGINE
+    if engine == "numexpr" and not all(
+        is_numeric_dtype(col) or is_bool_dtype(col) for col in local_dict.values()
+    ):
+        engine = "python"
+    return pd.eval(expression, engine=engine, parser="pandas", local_dict=local_dict, global_dict={})
+
+
+def _isnull(series):
+    """Máscara de nulos; columnas float numpy con np.isnan directo (sin el dispatch de pd.isna)."""
+    dtype = getattr(series, "dtype", None)
+    if isinstance(series, pd.Series) and isinstance(dtype, np.dtype) and dtype.kind == "f":
+        return pd.Series(np.isnan(series.to_numpy()), index=series.index, copy=False)
+    return pd.isna(series)
+
+
+def _as_bool_array(mask, na_value: bool = False) -> np.ndarray:
+    """Máscara como array bool de numpy; los NA de dtypes nullable (Int64, boolean) valen na_value."""
+    if isinstance(mask, (pd.Series, pd.api.extensions.ExtensionArray)):
+        return mask.to_numpy(dtype=bool, na_value=na_value)
+    return np.asarray(mask, dtype=bool)
 
 
 class BusinessRulesEngine:
@@ -83,30 +174,30 @@ class BusinessRulesEngine:
         self.rules = rules
 
     def evaluate(self, df: pd.DataFrame) -> List[CheckResult]:
-        """Evalúa todas las reglas y retorna CheckResults."""
-        results = []
-        for rule in self.rules:
-            try:
-                result = self._evaluate_rule(rule, df)
-                results.append(result)
-            except Exception as e:
-                logger.warning("Error evaluando regla '%s': %s", rule.get('name', '?'), e)
-                results.append(CheckResult(
-                    check_id="BUSINESS_RULE",
-                    column="__dataset__",
-                    passed=True,
-                    severity="INFO",
-                    value=0.0,
-                    threshold=0.0,
-                    message=f"Error evaluando regla '{rule.get('name', '?')}': {e}",
-                    metadata={"error": True, "rule_name": rule.get("name", "")},
-                ))
-        return results
+        """Evalúa todas las reglas y retorna CheckResults (en el orden de las reglas)."""
+        return [self._evaluate_rule_safe(rule, df) for rule in self.rules]
+
+    def _evaluate_rule_safe(self, rule: Dict, df: pd.DataFrame) -> CheckResult:
+        """_evaluate_rule que convierte cualquier error en un CheckResult INFO."""
+        try:
+            return self._evaluate_rule(rule, df)
+        except Exception as e:
+            logger.warning("Error evaluando regla '%s': %s", rule.get('name', '?'), e)
+            return CheckResult(
+                check_id="BUSINESS_RULE",
+                column="__dataset__",
+                passed=True,
+                severity="INFO",
+                value=0.0,
+                threshold=0.0,
+                message=f"Error evaluando regla '{rule.get('name', '?')}': {e}",
+                metadata={"error": True, "rule_name": rule.get("name", "")},
+            )
 
     def _safe_eval(self, df: pd.DataFrame, expression: str, expr_type: str = "expression") -> pd.Series:
         """Evalúa una expresión de forma segura, validando antes de ejecutar."""
         _validate_expression(expression, expr_type)
-        return df.eval(expression)
+        return _pandas_eval(df, expression)
 
     def _evaluate_rule(self, rule: Dict, df: pd.DataFrame) -> CheckResult:
         """Evalúa una sola regla de negocio."""
@@ -125,19 +216,24 @@ class BusinessRulesEngine:
                 metadata={"rule_name": name},
             )
 
-        # Aplicar condición (filtrar filas donde aplica la regla)
+        # Condición y assertion se evalúan sobre el df completo (sin copiar df[mask])
+        # y se fusionan en una sola máscara de violaciones
         if condition:
             try:
                 mask = self._safe_eval(df, condition, f"condición de regla '{name}'")
             except Exception:
                 # Intentar con evaluación manual para condiciones con "is not null"
                 mask = self._eval_condition(condition, df)
-            applicable_df = df[mask]
         else:
-            applicable_df = df
-            mask = pd.Series(True, index=df.index)
+            mask = None
+        # None = todas las filas aplican (sin reservar una máscara de True)
+        if mask is None:
+            cond_mask = None
+            n_applicable = n_total
+        else:
+            cond_mask = _as_bool_array(mask)
+            n_applicable = int(np.count_nonzero(cond_mask))
 
-        n_applicable = len(applicable_df)
         if n_applicable == 0:
             return CheckResult(
                 check_id="BUSINESS_RULE", column="__dataset__", passed=True,
@@ -148,16 +244,33 @@ class BusinessRulesEngine:
 
         # Evaluar assertion
         try:
-            assertion_mask = self._safe_eval(applicable_df, assertion, f"assertion de regla '{name}'")
+            assertion_mask = self._safe_eval(df, assertion, f"assertion de regla '{name}'")
         except Exception:
-            assertion_mask = self._eval_assertion(assertion, applicable_df)
-
-        violations = int((~assertion_mask).sum())
+            assertion_mask = self._eval_assertion(assertion, df)
+
+        # Un NA en la assertion no cuenta como violación; en la condición, la fila no aplica
+        violation_mask = None
+        if assertion_mask is None:
+            # Assertion no evaluable (None = todas las filas la cumplen)
+            violations = 0
+        elif cond_mask is None:
+            assert_arr = np.broadcast_to(_as_bool_array(assertion_mask, na_value=True), (n_total,))
+            violations = n_total - int(np.count_nonzero(assert_arr))
+        else:
+            assert_arr = np.broadcast_to(_as_bool_array(assertion_mask, na_value=True), (n_total,))
+            # cond & ~assert en una sola operación (True > False), sin el temporal de ~
+            violation_mask = np.greater(cond_mask, assert_arr)
+            violations = int(np.count_nonzero(violation_mask))
         violation_pct = violations / n_total
         passed = violations == 0
 
         # Obtener índices de violaciones para flagged_rows
-        violation_indices = applicable_df[~assertion_mask].index.tolist()[:20]
+        if passed:
+            violation_indices = []
+        else:
+            if violation_mask is None:
+                violation_mask = ~assert_arr
+            violation_indices = df.index[np.flatnonzero(violation_mask)[:20]].tolist()
 
         return CheckResult(
             check_id="BUSINESS_RULE",
@@ -178,8 +291,8 @@ class BusinessRulesEngine:
             },
         )
 
-    def _eval_condition(self, condition: str, df: pd.DataFrame) -> pd.Series:
-        """Evaluación manual para condiciones que pd.eval no soporta."""
+    def _eval_condition(self, condition: str, df: pd.DataFrame) -> Optional[pd.Series]:
+        """Evaluación manual para condiciones que pd.eval no soporta; None = todas las filas."""
         _validate_expression(condition, "condición")
         cond = condition.strip()
 
@@ -187,30 +300,35 @@ class BusinessRulesEngine:
         if " is not null" in cond.lower():
             col = cond.lower().replace(" is not null", "").strip()
             if col in df.columns:
-                return df[col].notna()
+                return ~_isnull(df[col])
 
         # "column is null"
         if " is null" in cond.lower():
             col = cond.lower().replace(" is null", "").strip()
             if col in df.columns:
-                return df[col].isna()
+                return _isnull(df[col])
 
-        return pd.Series(True, index=df.index)
+        return None
 
-    def _eval_assertion(self, assertion: str, df: pd.DataFrame) -> pd.Series:
-        """Evaluación manual para assertions complejas."""
+    def _eval_assertion(self, assertion: str, df: pd.DataFrame) -> Optional[pd.Series]:
+        """Evaluación manual para assertions complejas; None = se cumple en todas las filas."""
         _validate_expression(assertion, "assertion")
 
-        # Intentar con "and" splitting
+        # Intentar con "and" splitting: una máscara por parte y una sola reducción
         if " and " in assertion.lower():
-            parts = assertion.split(" and ")
-            result = pd.Series(True, index=df.index)
-            for part in parts:
+            masks = []
+            for part in _AND_SPLIT_RE.split(assertion.strip()):
                 try:
-                    _validate_expression(part.strip(), "sub-assertion")
-                    result = result & df.eval(part.strip())
+                    part_mask = self._safe_eval(df, part, "sub-assertion")
+                    masks.append(_as_bool_array(part_mask, na_value=True))
                 except Exception:
-                    logger.warning("Sub-assertion no evaluable: %s", part.strip())
-            return result
-
-        return pd.Series(True, index=df.index)
+                    logger.warning("Sub-assertion no evaluable: %s", part)
+            if not masks:
+                return None
+            if len(masks) <= 2:
+                combined = masks[0] if len(masks) == 1 else masks[0] & masks[1]
+            else:
+                combined = np.logical_and.reduce(masks)
+            return pd.Series(combined, index=df.index, copy=False)
+
+        return None
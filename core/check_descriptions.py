@@ -3,6 +3,8 @@ Descripciones amigables para ejecutivos de todos los checks del framework.
 Importar desde aqui en todos los generadores de reportes.
 """
 
+from types import MappingProxyType
+
 # Titulo corto y claro para cada check (reemplaza el check_id tecnico)
 CHECK_FRIENDLY_TITLE = {
     # Universales
@@ -261,26 +263,47 @@ STAT_LABEL = {
 }
 
 
-def friendly_title(check_id: str) -> str:
-    """Devuelve titulo amigable para un check_id. Fallback: el propio check_id."""
-    return CHECK_FRIENDLY_TITLE.get(check_id, check_id)
+class _KeyFallback(dict):
+    """dict cuya consulta devuelve la propia clave si no existe."""
+
+    def __missing__(self, key):
+        return key
+
+
+class _EmptyFallback(dict):
+    """dict cuya consulta devuelve cadena vacia si la clave no existe."""
+
+    def __missing__(self, key):
+        return ""
+
 
+# Helpers de consulta: __getitem__ ligado (llamada en C, sin frame de Python por fila del reporte).
+# Copias de los diccionarios de arriba, ya que se toman al importar el modulo.
 
-def business_impact(check_id: str) -> str:
-    """Devuelve explicacion de impacto de negocio. Cadena vacia si no hay."""
-    return CHECK_BUSINESS_IMPACT.get(check_id, "")
+# Titulo amigable para un check_id. Fallback: el propio check_id
+friendly_title = _KeyFallback(CHECK_FRIENDLY_TITLE).__getitem__
 
+# Explicacion de impacto de negocio. Cadena vacia si no hay
+business_impact = _EmptyFallback(CHECK_BUSINESS_IMPACT).__getitem__
 
-def friendly_type(semantic_type: str) -> str:
-    """Traduce tipo semantico a etiqueta amigable."""
-    return SEMANTIC_TYPE_LABEL.get(semantic_type, semantic_type)
+# Tipo semantico -> etiqueta amigable
+friendly_type = _KeyFallback(SEMANTIC_TYPE_LABEL).__getitem__
 
+# Etiqueta amigable para severidad
+friendly_severity = _KeyFallback(SEVERITY_LABEL).__getitem__
 
-def friendly_severity(severity: str) -> str:
-    """Devuelve etiqueta amigable para severidad."""
-    return SEVERITY_LABEL.get(severity, severity)
+# Nombre corto para severidad
+severity_short = _KeyFallback(SEVERITY_LABEL_SHORT).__getitem__
 
 
-def severity_short(severity: str) -> str:
-    """Devuelve nombre corto para severidad."""
-    return SEVERITY_LABEL_SHORT.get(severity, severity)
+# Diccionarios de solo lectura: los helpers de arriba trabajan sobre copias tomadas al importar,
+# asi que una mutacion posterior quedaria desincronizada; con MappingProxyType falla en el acto
+CHECK_FRIENDLY_TITLE = MappingProxyType(CHECK_FRIENDLY_TITLE)
+CHECK_BUSINESS_IMPACT = MappingProxyType(CHECK_BUSINESS_IMPACT)
+SEMANTIC_TYPE_LABEL = MappingProxyType(SEMANTIC_TYPE_LABEL)
+SEVERITY_LABEL = MappingProxyType(SEVERITY_LABEL)
+SEVERITY_LABEL_SHORT = MappingProxyType(SEVERITY_LABEL_SHORT)
+SEVERITY_EMOJI = MappingProxyType(SEVERITY_EMOJI)
+GRADE_EMOJI = MappingProxyType(GRADE_EMOJI)
+GRADE_LABEL = MappingProxyType(GRADE_LABEL)
+STAT_LABEL = MappingProxyType(STAT_LABEL)
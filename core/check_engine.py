@@ -1,6 +1,9 @@
+import importlib
 import logging
 import sys
-from typing import List, Dict, Optional
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
 
 import pandas as pd
 
@@ -12,13 +15,78 @@ from core.config_loader import ConfigLoader
 logger = logging.getLogger(__name__)
 
 
+def _optional_runner(module_name: str, func_name: str):
+    """Función de un análisis de dataset importada al cargar el módulo; None si no está disponible."""
+    try:
+        return getattr(importlib.import_module(module_name), func_name)
+    except ImportError as e:
+        logger.warning("Análisis %s.%s no disponible: %s", module_name, func_name, e)
+        return None
+
+
+def _has_two_columns(context) -> bool:
+    return len(context["df"].columns) >= 2
+
+
+def _has_date_column(context) -> bool:
+    # dt_cache contiene la columna de fecha de los checks temporales, si existe en df
+    return bool(context["dt_cache"])
+
+
+# Análisis a nivel dataset: (check_id, descripción, función, args, kwargs, aplica).
+# args/kwargs son nombres del contexto del run (df, df_raw, column_types, date_col, dt_cache);
+# aplica(contexto) -> bool evita ejecutar análisis que no pueden producir resultados.
+_DATASET_CHECKS = (
+    ("CROSS_COLUMN", "análisis cross-column",
+     _optional_runner("checks.cross_column_checks", "run_cross_column_checks"),
+     ("df", "df_raw", "column_types"), (), _has_two_columns),
+    ("NULL_PATTERNS", "análisis de nulidad",
+     _optional_runner("checks.null_pattern_checks", "run_null_pattern_checks"),
+     ("df", "df_raw"), (), None),
+    ("TIMESERIES", "análisis temporal",
+     _optional_runner("checks.timeseries_checks", "run_timeseries_checks"),
+     ("df", "df_raw", "column_types"), ("date_col", "dt_cache"), _has_date_column),
+    ("PII_DETECTION", "detección PII",
+     _optional_runner("checks.pii_checks", "run_pii_checks"),
+     ("df_raw", "df"), (), None),
+    ("TEMPORAL_COMPLETENESS", "completitud temporal",
+     _optional_runner("checks.temporal_completeness_checks", "run_temporal_completeness_checks"),
+     ("df", "df_raw", "column_types"), ("date_col", "dt_cache"), _has_date_column),
+)
+
+
+# Plantillas de error "Tipo: mensaje": %.200s trunca str(e) al formatear, así los logs
+# solo se formatean si el registro se emite y el mensaje del resultado en una sola operación
+_CHECK_ERROR_LOG = "Check %s falló en columna '%s': %s: %.200s"
+_CHECK_ERROR_MESSAGE = "Error al ejecutar check: %s: %.200s"
+_DATASET_ERROR_LOG = "Error en %s: %s: %.200s"
+_BATCH_ERROR_LOG = "Check %s por bloque falló (%s); se evalúa por columna: %s: %.200s"
+
+
+def _error_result(check_id: str, column: str, message: str, metadata: dict) -> CheckResult:
+    """Resultado INFO de un check que falló (error controlado, nunca crash)."""
+    return CheckResult(
+        check_id=check_id, column=column, passed=True, severity="INFO",
+        value=0.0, threshold=0.0, message=message, metadata=metadata,
+    )
+
+
+# Serie vacía compartida para columnas de column_types que no están en el DataFrame
+_EMPTY_STR_SERIES = pd.Series(dtype=str)
+
+# Checks por columna encolados en el pool por delante del resultado entregado, por hilo
+SUBMIT_AHEAD_PER_WORKER = 4
+
+
 class CheckEngine:
     """Capa 4: Ejecuta todos los checks aplicables de forma segura."""
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, max_workers=1):
         self.registry = CheckRegistry()
         self._duplicate_checked = False
         self.config = config
+        # Hilos para ejecutar checks (1 = en serie, por defecto; > 1 = pool de hilos, opcional)
+        self.max_workers = max_workers
 
     def run_all(
         self,
@@ -28,26 +96,104 @@ class CheckEngine:
         date_col: Optional[str] = None,
     ) -> List[CheckResult]:
         """Ejecuta todos los checks para todas las columnas según su tipo semántico."""
-        results = []
+        return list(self.run_all_iter(df_raw, df, column_types, date_col=date_col))
+
+    def run_all_iter(
+        self,
+        df_raw: pd.DataFrame,
+        df: pd.DataFrame,
+        column_types: Dict[str, SemanticType],
+        date_col: Optional[str] = None,
+    ) -> Iterator[CheckResult]:
+        """Como run_all, pero entrega cada resultado al calcularlo (mismo orden).
+
+        Permite escribir resultados a un sink (p.ej. JSON-lines) sin mantener la lista completa.
+        """
+        # El engine puede reutilizarse entre datasets (p.ej. un worker de batch)
+        self._duplicate_checked = False
+
+        # Config resuelta una vez por run (no por cada par columna × check)
+        check_ids = self.registry.get_all_check_ids()
+        enabled = {cid for cid in check_ids if ConfigLoader.is_check_enabled(self.config, cid)}
+        overrides = {cid: ov for cid in check_ids
+                     if (ov := ConfigLoader.get_severity_override(self.config, cid))}
 
         # Metadata compartida
+        dt_cache = self._build_datetime_cache(df, column_types, date_col)
         base_metadata = {
             "_df_raw": df_raw,
             "_df": df,
             "_date_col": date_col,
         }
 
+        # Series de cada columna en una sola pasada (en vez de df[col] + validación por columna)
+        raw_columns = dict(df_raw.items())
+        typed_columns = dict(df.items())
+
+        # Checks con implementación por bloque: una sola llamada por tipo semántico
+        batched = self._run_batched(df_raw, df, column_types, base_metadata, enabled)
+
+        plan = self._plan(column_types, raw_columns, typed_columns, base_metadata, batched, enabled)
+        dataset_context = {
+            "df": df, "df_raw": df_raw, "column_types": column_types,
+            "date_col": date_col, "dt_cache": dt_cache,
+        }
+        dataset_steps = self._dataset_steps(dataset_context)
+        workers = self.max_workers or 1
+        if workers <= 1:
+            for check_id, result, task in plan:
+                if task is not None:
+                    result = self._safe_execute(*task)
+                yield self._with_override(check_id, result, overrides)
+            for step in dataset_steps:
+                yield from self._run_dataset_step(step, dataset_context)
+        else:
+            # Único nivel con hilos (los checks no abren pools propios): solo leen los DataFrames
+            # compartidos y únicamente se solapan los tramos en kernels de numpy/scipy; el resto
+            # del trabajo retiene el GIL. Se entrega en orden: resultado idéntico al serie.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Los de dataset (los más largos) se encolan primero
+                dataset_futures = [executor.submit(self._run_dataset_step, step, dataset_context)
+                                   for step in dataset_steps]
+                # Como mucho workers * SUBMIT_AHEAD_PER_WORKER checks en vuelo: el plan se
+                # consume a medida que se entregan resultados, no entero antes del primero
+                limit = workers * SUBMIT_AHEAD_PER_WORKER
+                pending = deque()
+                in_flight = 0
+                for check_id, result, task in plan:
+                    if task is not None:
+                        while in_flight >= limit:
+                            entry = pending.popleft()
+                            in_flight -= entry[2]
+                            yield self._pending_result(entry, overrides)
+                        result = executor.submit(self._safe_execute, *task)
+                        in_flight += 1
+                    pending.append((check_id, result, task is not None))
+                while pending:
+                    yield self._pending_result(pending.popleft(), overrides)
+                for future in dataset_futures:
+                    yield from future.result()
+
+    def _plan(self, column_types, raw_columns, typed_columns, base_metadata, batched, enabled):
+        """(check_id, resultado por bloque, task) por par (columna, check), en orden de salida.
+
+        Generador: los pares se arman a medida que se consumen. task es None si el resultado
+        ya viene del bloque; el filtro de config y DUPLICATE_ROWS se resuelven aquí.
+        """
         for col, sem_type in column_types.items():
             checks = self.registry.get_checks_for_type(sem_type)
-            series_raw = df_raw[col] if col in df_raw.columns else pd.Series(name=col, dtype=str)
-            series_typed = df[col] if col in df.columns else series_raw
+            series_raw = raw_columns.get(col)
+            if series_raw is None:
+                # Columna ausente (p.ej. column_types de otro schema): vista renombrada del vacío compartido
+                series_raw = _EMPTY_STR_SERIES.rename(col)
+            series_typed = typed_columns.get(col, series_raw)
+            col_metadata = dict(base_metadata, _semantic_type=sem_type)
 
             for check_def in checks:
                 check_id = check_def["check_id"]
-                func = check_def["function"]
 
                 # Check si está deshabilitado por config
-                if not ConfigLoader.is_check_enabled(self.config, check_id):
+                if check_id not in enabled:
                     continue
 
                 # DUPLICATE_ROWS solo se ejecuta una vez (nivel dataset)
@@ -56,91 +202,94 @@ class CheckEngine:
                         continue
                     self._duplicate_checked = True
 
-                result = self._safe_execute(func, series_raw, series_typed, base_metadata, check_id, col)
+                precomputed = batched.get((check_id, col))
+                task = None
+                if precomputed is None:
+                    task = (check_def["function"], series_raw, series_typed, col_metadata, check_id, col)
+                yield check_id, precomputed, task
 
-                # Aplicar severity override si existe en config
-                if result and not result.passed:
-                    override = ConfigLoader.get_severity_override(self.config, check_id)
-                    if override:
-                        result.severity = override
+    def _pending_result(self, entry, overrides) -> CheckResult:
+        """Resultado de una entrada de la cola del pool (espera al future si lo es)."""
+        check_id, result, is_future = entry
+        return self._with_override(check_id, result.result() if is_future else result, overrides)
 
-                results.append(result)
+    @staticmethod
+    def _with_override(check_id, result, overrides) -> CheckResult:
+        """Aplica el severity override de config al resultado fallido, si existe."""
+        if result and not result.passed:
+            override = overrides.get(check_id)
+            if override:
+                result.severity = override
+        return result
 
-        # ── Checks a nivel dataset ──
-        results.extend(self._run_dataset_checks(df, df_raw, column_types, date_col))
+    def _run_batched(self, df_raw, df, column_types, base_metadata, enabled) -> Dict[tuple, CheckResult]:
+        """Ejecuta los checks con "batch_function" una vez por grupo de columnas del mismo tipo.
 
-        return results
+        Retorna {(check_id, columna): CheckResult}. Si un check por bloque falla, o no devuelve
+        alguna columna, esas columnas se evalúan después con la función por columna.
+        """
+        groups = defaultdict(list)
+        for col, sem_type in column_types.items():
+            if col in df_raw.columns and col in df.columns:
+                groups[sem_type].append(col)
 
-    def _run_dataset_checks(self, df, df_raw, column_types, date_col):
-        """Ejecuta checks que operan a nivel dataset (cross-column, null patterns, etc.)."""
-        results = []
+        batched = {}
+        for sem_type, cols in groups.items():
+            batch_defs = [c for c in self.registry.get_checks_for_type(sem_type)
+                          if "batch_function" in c and c["check_id"] in enabled]
+            if not batch_defs:
+                continue
+            raw_block, typed_block = df_raw[cols], df[cols]
+            metadata = dict(base_metadata, _semantic_type=sem_type)
+            for check_def in batch_defs:
+                check_id = check_def["check_id"]
+                try:
+                    block_results = check_def["batch_function"](raw_block, typed_block, metadata)
+                except Exception as e:
+                    logger.warning(_BATCH_ERROR_LOG, check_id, sem_type.value, type(e).__name__, e)
+                    continue
+                for col, result in block_results.items():
+                    batched[(check_id, col)] = result
+        return batched
 
-        # Cross-column correlation analysis
-        try:
-            from checks.cross_column_checks import run_cross_column_checks
-            results.extend(run_cross_column_checks(df, df_raw, column_types))
-        except Exception as e:
-            logger.warning("Error en análisis cross-column: %s: %s", type(e).__name__, str(e)[:200])
-            results.append(CheckResult(
-                check_id="CROSS_COLUMN", column="__dataset__", passed=True, severity="INFO",
-                value=0.0, threshold=0.0,
-                message=f"Error en análisis cross-column: {type(e).__name__}: {str(e)[:200]}",
-                metadata={"error": True},
-            ))
-
-        # Null pattern analysis
-        try:
-            from checks.null_pattern_checks import run_null_pattern_checks
-            results.extend(run_null_pattern_checks(df, df_raw))
-        except Exception as e:
-            logger.warning("Error en análisis de nulidad: %s: %s", type(e).__name__, str(e)[:200])
-            results.append(CheckResult(
-                check_id="NULL_PATTERNS", column="__dataset__", passed=True, severity="INFO",
-                value=0.0, threshold=0.0,
-                message=f"Error en análisis de nulidad: {type(e).__name__}: {str(e)[:200]}",
-                metadata={"error": True},
-            ))
-
-        # Time series checks
-        try:
-            from checks.timeseries_checks import run_timeseries_checks
-            results.extend(run_timeseries_checks(df, df_raw, column_types, date_col=date_col))
-        except Exception as e:
-            logger.warning("Error en análisis temporal: %s: %s", type(e).__name__, str(e)[:200])
-            results.append(CheckResult(
-                check_id="TIMESERIES", column="__dataset__", passed=True, severity="INFO",
-                value=0.0, threshold=0.0,
-                message=f"Error en análisis temporal: {type(e).__name__}: {str(e)[:200]}",
-                metadata={"error": True},
-            ))
-
-        # PII detection
-        try:
-            from checks.pii_checks import run_pii_checks
-            results.extend(run_pii_checks(df_raw, df))
-        except Exception as e:
-            logger.warning("Error en detección PII: %s: %s", type(e).__name__, str(e)[:200])
-            results.append(CheckResult(
-                check_id="PII_DETECTION", column="__dataset__", passed=True, severity="INFO",
-                value=0.0, threshold=0.0,
-                message=f"Error en detección PII: {type(e).__name__}: {str(e)[:200]}",
-                metadata={"error": True},
-            ))
-
-        # Temporal completeness
+    @staticmethod
+    def _build_datetime_cache(df, column_types, date_col=None) -> Dict[str, pd.Series]:
+        """{columna: serie datetime} solo de la columna que usan los checks temporales.
+
+        Es date_col si está en df y, si no, la primera DATE/DATETIME (mismo criterio que
+        timeseries y temporal completeness); vacío si no hay ninguna.
+        """
+        if date_col and date_col in df.columns:
+            dt_col = date_col
+        else:
+            dt_col = next((c for c, t in column_types.items()
+                           if t in (SemanticType.DATE, SemanticType.DATETIME)), None)
+        if dt_col is None or dt_col not in df.columns:
+            return {}
+        return {dt_col: pd.to_datetime(df[dt_col], errors="coerce", cache=True)}
+
+    def _dataset_steps(self, context) -> list:
+        """Entradas de _DATASET_CHECKS a ejecutar: disponibles, habilitadas en config y aplicables."""
+        if len(context["df"]) == 0:
+            return []
+        return [
+            step for step in _DATASET_CHECKS
+            if step[2] is not None and ConfigLoader.is_check_enabled(self.config, step[0])
+            and (step[5] is None or step[5](context))
+        ]
+
+    @staticmethod
+    def _run_dataset_step(step, context) -> List[CheckResult]:
+        """Ejecuta una entrada de _DATASET_CHECKS; un error genera un resultado INFO, nunca crash."""
+        check_id, label, func, arg_names, kwarg_names, _ = step
         try:
-            from checks.temporal_completeness_checks import run_temporal_completeness_checks
-            results.extend(run_temporal_completeness_checks(df, df_raw, column_types, date_col=date_col))
+            return func(*(context[name] for name in arg_names),
+                        **{name: context[name] for name in kwarg_names})
         except Exception as e:
-            logger.warning("Error en completitud temporal: %s: %s", type(e).__name__, str(e)[:200])
-            results.append(CheckResult(
-                check_id="TEMPORAL_COMPLETENESS", column="__dataset__", passed=True, severity="INFO",
-                value=0.0, threshold=0.0,
-                message=f"Error en completitud temporal: {type(e).__name__}: {str(e)[:200]}",
-                metadata={"error": True},
-            ))
-
-        return results
+            error_type = type(e).__name__
+            logger.warning(_DATASET_ERROR_LOG, label, error_type, e)
+            return [_error_result(check_id, "__dataset__", _DATASET_ERROR_LOG % (label, error_type, e),
+                                  {"error": True})]
 
     def _safe_execute(
         self,
@@ -155,15 +304,7 @@ class CheckEngine:
         try:
             return func(series_raw, series_typed, metadata)
         except Exception as e:
-            logger.warning("Check %s falló en columna '%s': %s: %s",
-                           check_id, column, type(e).__name__, str(e)[:200])
-            return CheckResult(
-                check_id=check_id,
-                column=column,
-                passed=True,
-                severity="INFO",
-                value=0.0,
-                threshold=0.0,
-                message=f"Error al ejecutar check: {type(e).__name__}: {str(e)[:200]}",
-                metadata={"error": True, "error_type": type(e).__name__},
-            )
+            error_type = type(e).__name__
+            logger.warning(_CHECK_ERROR_LOG, check_id, column, error_type, e)
+            return _error_result(check_id, column, _CHECK_ERROR_MESSAGE % (error_type, e),
+                                 {"error": True, "error_type": error_type})
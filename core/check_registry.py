@@ -1,4 +1,5 @@
-from typing import List, Dict, Callable
+from itertools import chain
+from typing import List, Dict, Tuple
 
 from models.semantic_type import SemanticType
 from checks.universal_checks import UNIVERSAL_CHECKS
@@ -11,50 +12,60 @@ from checks.hypothesis_checks import HYPOTHESIS_NUMERIC_CHECKS, HYPOTHESIS_CATEG
 from checks.benford_check import BENFORD_CHECKS
 
 
+def _mk(*groups) -> Tuple[dict, ...]:
+    """Tupla inmutable con los checks de los grupos, sin listas intermedias (list + list + ...)."""
+    return tuple(chain.from_iterable(groups))
+
+
+# Tuplas inmutables: se comparten entre todas las columnas sin copias
+_UNIVERSAL_TUPLE = _mk(UNIVERSAL_CHECKS)
+
 # Mapeo de checks a tipos semánticos
-TYPE_CHECK_MAP: Dict[SemanticType, List[dict]] = {
+TYPE_CHECK_MAP: Dict[SemanticType, Tuple[dict, ...]] = {
     # Numéricos
-    SemanticType.NUMERIC_CONTINUOUS: UNIVERSAL_CHECKS + NUMERIC_CHECKS + HYPOTHESIS_NUMERIC_CHECKS + BENFORD_CHECKS,
-    SemanticType.NUMERIC_DISCRETE: UNIVERSAL_CHECKS + NUMERIC_CHECKS + HYPOTHESIS_NUMERIC_CHECKS + BENFORD_CHECKS,
+    SemanticType.NUMERIC_CONTINUOUS: _mk(UNIVERSAL_CHECKS, NUMERIC_CHECKS, HYPOTHESIS_NUMERIC_CHECKS, BENFORD_CHECKS),
+    SemanticType.NUMERIC_DISCRETE: _mk(UNIVERSAL_CHECKS, NUMERIC_CHECKS, HYPOTHESIS_NUMERIC_CHECKS, BENFORD_CHECKS),
 
     # Fechas
-    SemanticType.DATE: UNIVERSAL_CHECKS + DATE_CHECKS,
-    SemanticType.DATETIME: UNIVERSAL_CHECKS + DATE_CHECKS,
+    SemanticType.DATE: _mk(UNIVERSAL_CHECKS, DATE_CHECKS),
+    SemanticType.DATETIME: _mk(UNIVERSAL_CHECKS, DATE_CHECKS),
 
     # Categóricos
-    SemanticType.CATEGORICAL: UNIVERSAL_CHECKS + CATEGORICAL_CHECKS + HYPOTHESIS_CATEGORICAL_CHECKS,
-    SemanticType.BOOLEAN: UNIVERSAL_CHECKS + CATEGORICAL_CHECKS + HYPOTHESIS_CATEGORICAL_CHECKS,
+    SemanticType.CATEGORICAL: _mk(UNIVERSAL_CHECKS, CATEGORICAL_CHECKS, HYPOTHESIS_CATEGORICAL_CHECKS),
+    SemanticType.BOOLEAN: _mk(UNIVERSAL_CHECKS, CATEGORICAL_CHECKS, HYPOTHESIS_CATEGORICAL_CHECKS),
 
     # Texto / Alta cardinalidad
-    SemanticType.HIGH_CARDINALITY: UNIVERSAL_CHECKS + TEXT_CHECKS_GENERIC,
-    SemanticType.EMAIL: UNIVERSAL_CHECKS + TEXT_CHECKS_GENERIC + EMAIL_CHECKS,
-    SemanticType.PHONE: UNIVERSAL_CHECKS + TEXT_CHECKS_GENERIC + PHONE_CHECKS,
+    SemanticType.HIGH_CARDINALITY: _mk(UNIVERSAL_CHECKS, TEXT_CHECKS_GENERIC),
+    SemanticType.EMAIL: _mk(UNIVERSAL_CHECKS, TEXT_CHECKS_GENERIC, EMAIL_CHECKS),
+    SemanticType.PHONE: _mk(UNIVERSAL_CHECKS, TEXT_CHECKS_GENERIC, PHONE_CHECKS),
 
     # IDs
-    SemanticType.ID_CANDIDATE: UNIVERSAL_CHECKS + ID_CHECKS,
+    SemanticType.ID_CANDIDATE: _mk(UNIVERSAL_CHECKS, ID_CHECKS),
 
     # Especiales
-    SemanticType.MIXED: UNIVERSAL_CHECKS,
-    SemanticType.EMPTY: UNIVERSAL_CHECKS,
-    SemanticType.CONSTANT: UNIVERSAL_CHECKS,
+    SemanticType.MIXED: _UNIVERSAL_TUPLE,
+    SemanticType.EMPTY: _UNIVERSAL_TUPLE,
+    SemanticType.CONSTANT: _UNIVERSAL_TUPLE,
 }
 
+# Misma tabla indexada por SemanticType.index (lookup sin hashear el Enum)
+_TYPE_CHECKS_BY_INDEX: Tuple[Tuple[dict, ...], ...] = tuple(
+    TYPE_CHECK_MAP.get(member, _UNIVERSAL_TUPLE) for member in SemanticType
+)
+
+# check_ids únicos (en orden de registro), calculados una sola vez al importar
+ALL_CHECK_IDS: Tuple[str, ...] = tuple(dict.fromkeys(
+    check["check_id"] for checks in TYPE_CHECK_MAP.values() for check in checks
+))
+
 
 class CheckRegistry:
     """Capa 3: Mapa declarativo de qué checks aplican a cada tipo semántico."""
 
-    def get_checks_for_type(self, semantic_type: SemanticType) -> List[dict]:
-        """Retorna la lista de checks aplicables a un tipo semántico."""
-        return TYPE_CHECK_MAP.get(semantic_type, UNIVERSAL_CHECKS)
+    def get_checks_for_type(self, semantic_type: SemanticType) -> Tuple[dict, ...]:
+        """Retorna los checks aplicables a un tipo semántico (tupla compartida, no copiar)."""
+        return _TYPE_CHECKS_BY_INDEX[semantic_type.index]
 
     def get_all_check_ids(self) -> List[str]:
         """Retorna todos los check_ids registrados (sin duplicados)."""
-        seen = set()
-        ids = []
-        for checks in TYPE_CHECK_MAP.values():
-            for check in checks:
-                cid = check["check_id"]
-                if cid not in seen:
-                    seen.add(cid)
-                    ids.append(cid)
-        return ids
+        return list(ALL_CHECK_IDS)
@@ -10,7 +10,7 @@ Formato del config YAML:
     OUTLIER_IQR:
       CRITICAL: 0.15
       HIGH: 0.08
-  disabled_checks:
+  disabled_checks:      # check_ids o análisis de dataset (CROSS_COLUMN, NULL_PATTERNS, TIMESERIES, ...)
     - NORMALITY_TEST
     - BENFORD_LAW
   severity_overrides:
@@ -35,13 +35,27 @@ Formato del config YAML:
       parent_column: id
 """
 
+import functools
 import logging
+import os
+import sys
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
-VALID_SEVERITIES = {"CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO", "PASS"}
-VALID_SCORING_KEYS = {"CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"}
+_SEVERITY_NAMES = ("CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO", "PASS")
+_SCORING_NAMES = _SEVERITY_NAMES[:-1]
+# Conjuntos inmutables compartidos; strings internadas como las claves de los configs cargados
+VALID_SEVERITIES = frozenset(map(sys.intern, _SEVERITY_NAMES))
+VALID_SCORING_KEYS = frozenset(map(sys.intern, _SCORING_NAMES))
+# Valores válidos para los mensajes de error, en orden de severidad
+_VALID_SEVERITIES_TEXT = ", ".join(_SEVERITY_NAMES)
+_VALID_SCORING_TEXT = ", ".join(_SCORING_NAMES)
+
+# Defaults compartidos de los helpers de consulta (inmutables: no se crean en cada llamada)
+_NO_DISABLED = frozenset()
+_NO_MAPPING = MappingProxyType({})
 
 
 class ConfigValidationError(ValueError):
@@ -65,7 +79,7 @@ def _validate_config(config: Dict[str, Any]) -> None:
                     continue
                 for sev, val in levels.items():
                     if sev not in VALID_SEVERITIES:
-                        errors.append(f"thresholds.{check_id}.{sev}: severidad inválida (válidas: {VALID_SEVERITIES})")
+                        errors.append(f"thresholds.{check_id}.{sev}: severidad inválida (válidas: {_VALID_SEVERITIES_TEXT})")
                     if not isinstance(val, (int, float)):
                         errors.append(f"thresholds.{check_id}.{sev}: valor debe ser numérico, recibido: {type(val).__name__}")
 
@@ -88,7 +102,7 @@ def _validate_config(config: Dict[str, Any]) -> None:
             for check_id, sev in overrides.items():
                 if not isinstance(sev, str) or sev not in VALID_SEVERITIES:
                     errors.append(
-                        f"severity_overrides.{check_id}: '{sev}' no es severidad válida (válidas: {VALID_SEVERITIES})"
+                        f"severity_overrides.{check_id}: '{sev}' no es severidad válida (válidas: {_VALID_SEVERITIES_TEXT})"
                     )
 
     # ── scoring ──
@@ -99,7 +113,7 @@ def _validate_config(config: Dict[str, Any]) -> None:
         else:
             for key, val in scoring.items():
                 if key not in VALID_SCORING_KEYS:
-                    errors.append(f"scoring.{key}: clave inválida (válidas: {VALID_SCORING_KEYS})")
+                    errors.append(f"scoring.{key}: clave inválida (válidas: {_VALID_SCORING_TEXT})")
                 if not isinstance(val, (int, float)):
                     errors.append(f"scoring.{key}: valor debe ser numérico, recibido: {type(val).__name__}")
                 elif val < 0:
@@ -152,38 +166,75 @@ def _validate_config(config: Dict[str, Any]) -> None:
         msg = "Errores de validación en configuración YAML:\n  - " + "\n  - ".join(errors)
         raise ConfigValidationError(msg)
 
+# Loader YAML resuelto en la primera carga (ver _yaml_loader)
+_YAML_LOADER = None
+
+
+def _yaml_loader():
+    """CSafeLoader (parser C de libyaml) si está disponible; si no, SafeLoader en Python puro."""
+    global _YAML_LOADER
+    if _YAML_LOADER is None:
+        import yaml
+        _YAML_LOADER = getattr(yaml, "CSafeLoader", None)
+        if _YAML_LOADER is None:
+            logger.warning("PyYAML sin soporte libyaml: configuración parseada en Python puro (más lento)")
+            _YAML_LOADER = yaml.SafeLoader
+    return _YAML_LOADER
+
+
+def _intern(value):
+    """sys.intern para strings; otros valores (p.ej. claves YAML numéricas) se dejan igual."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parsea y valida config_path; mtime_ns/size solo forman parte de la clave de cache."""
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError("Se requiere PyYAML para configuración: pip install pyyaml")
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml.load(f, Loader=_yaml_loader()) or {}
+
+    if not isinstance(config, dict):
+        raise ConfigValidationError(
+            f"El archivo de configuración debe contener un dict YAML, recibido: {type(config).__name__}"
+        )
+
+    _validate_config(config)
+    logger.info("Configuración cargada y validada: %s", config_path)
+
+    # check_ids y severidades internados: los literales del código ya lo están, así las
+    # consultas posteriores (registry, overrides, etiquetas de reporte) comparan por identidad
+    return {
+        "thresholds": config.get("thresholds", {}),
+        "disabled_checks": frozenset(_intern(cid) for cid in config.get("disabled_checks", [])),
+        "severity_overrides": {
+            _intern(cid): _intern(sev) for cid, sev in config.get("severity_overrides", {}).items()
+        },
+        "scoring": config.get("scoring", {}),
+        "column_weights": config.get("column_weights", {}),
+        "business_rules": config.get("business_rules", []),
+        "foreign_keys": config.get("foreign_keys", []),
+    }
+
 
 class ConfigLoader:
     """Carga y aplica configuración desde YAML."""
 
     @staticmethod
     def load(config_path: str) -> Dict[str, Any]:
-        """Carga un archivo YAML de configuración con validación."""
-        try:
-            import yaml
-        except ImportError:
-            raise ImportError("Se requiere PyYAML para configuración: pip install pyyaml")
-
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+        """Carga un archivo YAML de configuración con validación.
 
-        if not isinstance(config, dict):
-            raise ConfigValidationError(
-                f"El archivo de configuración debe contener un dict YAML, recibido: {type(config).__name__}"
-            )
-
-        _validate_config(config)
-        logger.info("Configuración cargada y validada: %s", config_path)
-
-        return {
-            "thresholds": config.get("thresholds", {}),
-            "disabled_checks": set(config.get("disabled_checks", [])),
-            "severity_overrides": config.get("severity_overrides", {}),
-            "scoring": config.get("scoring", {}),
-            "column_weights": config.get("column_weights", {}),
-            "business_rules": config.get("business_rules", []),
-            "foreign_keys": config.get("foreign_keys", []),
-        }
+        El resultado se cachea por (ruta, mtime, tamaño): un archivo sin cambios no se
+        vuelve a parsear ni validar. Cada llamada recibe su propio dict de primer nivel;
+        los valores anidados son compartidos y no deben modificarse.
+        """
+        path = os.path.abspath(config_path)
+        st = os.stat(path)
+        return dict(_load_cached(path, st.st_mtime_ns, st.st_size))
 
     @staticmethod
     def default_config() -> Dict[str, Any]:
@@ -201,13 +252,13 @@ class ConfigLoader:
     def is_check_enabled(config: Optional[Dict], check_id: str) -> bool:
         if config is None:
             return True
-        return check_id not in config.get("disabled_checks", set())
+        return check_id not in config.get("disabled_checks", _NO_DISABLED)
 
     @staticmethod
     def get_threshold(config: Optional[Dict], check_id: str, default: Dict) -> Dict:
         if config is None:
             return default
-        overrides = config.get("thresholds", {}).get(check_id, {})
+        overrides = config.get("thresholds", _NO_MAPPING).get(check_id, _NO_MAPPING)
         if overrides:
             merged = dict(default)
             merged.update(overrides)
@@ -218,4 +269,4 @@ class ConfigLoader:
     def get_severity_override(config: Optional[Dict], check_id: str) -> Optional[str]:
         if config is None:
             return None
-        return config.get("severity_overrides", {}).get(check_id)
+        return config.get("severity_overrides", _NO_MAPPING).get(check_id)
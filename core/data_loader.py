@@ -1,4 +1,8 @@
+import codecs
+import io
 import os
+from typing import Optional
+
 import pandas as pd
 import chardet
 
@@ -6,41 +10,61 @@ import chardet
 DELIMITERS = [",", ";", "\t", "|"]
 MAX_COLUMNS = 500
 LARGE_FILE_MB = 500  # Archivos > 500MB usan sampling
+SAMPLE_ROWS = 100_000  # Filas leídas de un archivo grande sampleado
+LINE_COUNT_CHUNK = 4 << 20  # Bytes por lectura al contar líneas de un archivo grande
+ENCODING_SAMPLE_BYTES = 100_000  # Bytes iniciales para detectar el encoding
+DELIMITER_SAMPLE_BYTES = 1 << 18  # Bytes iniciales para detectar el delimiter (20 líneas)
+# Prefijo leído una sola vez y compartido por las detecciones (binario, encoding, delimiter)
+HEAD_SAMPLE_BYTES = max(ENCODING_SAMPLE_BYTES, DELIMITER_SAMPLE_BYTES)
 
 
 class DataLoader:
     """Capa 1: Carga robusta de CSV con detección automática de encoding y delimiter."""
 
-    def load(self, file_path: str):
+    def read_raw(self, file_path: str) -> Optional[bytes]:
+        """Lee el archivo completo a memoria (prefetch de I/O); None si es grande o no legible."""
+        try:
+            if os.path.getsize(file_path) / (1024 * 1024) > LARGE_FILE_MB:
+                return None
+            with open(file_path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def load(self, file_path: str, raw: Optional[bytes] = None):
         """Carga un CSV y retorna (df_raw, df, metadata).
 
         df_raw: todos los valores como strings (para inspección de formato).
         df: con tipos inferidos por pandas.
         metadata: dict con n_rows, n_cols, file_size_mb, encoding, delimiter.
+        raw: contenido ya leído con read_raw(); si se pasa, no se vuelve a leer del disco.
         """
         file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
 
+        # Una sola lectura del inicio del archivo: ninguna detección lee más de HEAD_SAMPLE_BYTES
+        head = raw
+        if head is None:
+            head = self._head(file_path, HEAD_SAMPLE_BYTES, None)
+            if len(head) < HEAD_SAMPLE_BYTES:
+                raw = head  # el prefijo es el archivo completo: read_csv lo usa sin volver a leer
+
         # Verificar que no es binario
-        self._check_not_binary(file_path)
+        self._check_not_binary(file_path, head)
 
-        encoding = self._detect_encoding(file_path)
-        delimiter = self._detect_delimiter(file_path, encoding)
+        encoding = self._detect_encoding(file_path, head)
+        delimiter = self._detect_delimiter(file_path, encoding, head)
 
         # Archivos grandes: sampling
         read_kwargs = {}
         sampled = False
         if file_size_mb > LARGE_FILE_MB:
-            # Estimar filas y samplear
-            with open(file_path, "r", encoding=encoding, errors="replace") as f:
-                for i, _ in enumerate(f):
-                    if i > 100_000:
-                        break
-            if i > 100_000:
-                read_kwargs["nrows"] = 100_000
+            # Samplear si hay más filas que SAMPLE_ROWS (+ header)
+            if self._has_more_lines(file_path, SAMPLE_ROWS + 1):
+                read_kwargs["nrows"] = SAMPLE_ROWS
                 sampled = True
 
         df_raw = pd.read_csv(
-            file_path,
+            self._source(file_path, raw),
             sep=delimiter,
             encoding=encoding,
             dtype=str,
@@ -50,7 +74,7 @@ class DataLoader:
         )
 
         df = pd.read_csv(
-            file_path,
+            self._source(file_path, raw),
             sep=delimiter,
             encoding=encoding,
             on_bad_lines="skip",
@@ -79,33 +103,87 @@ class DataLoader:
 
         return df_raw, df, metadata
 
-    def _check_not_binary(self, file_path: str):
-        """Detecta si un archivo es binario (no texto)."""
+    @staticmethod
+    def _has_more_lines(file_path: str, n: int) -> bool:
+        """True si el archivo tiene más de n líneas; lee en bloques y se detiene al superarlas.
+
+        Cuenta saltos de línea sobre bytes (memchr en C) en vez de decodificar e iterar líneas.
+        """
+        newline = None
+        count = 0
+        last = b""
+        with open(file_path, "rb") as f:
+            while chunk := f.read(LINE_COUNT_CHUNK):
+                if newline is None:
+                    # \n (o \r\n); archivos con solo \r como fin de línea cuentan \r
+                    newline = b"\n" if b"\n" in chunk or b"\r" not in chunk else b"\r"
+                count += chunk.count(newline)
+                if count > n:
+                    return True
+                last = chunk[-1:]
+        # Una última línea sin salto final también cuenta
+        return count + (1 if last and last != newline else 0) > n
+
+    @staticmethod
+    def _source(file_path: str, raw: Optional[bytes]):
+        """Ruta o buffer en memoria para read_csv (un BytesIO nuevo por lectura)."""
+        return io.BytesIO(raw) if raw is not None else file_path
+
+    @staticmethod
+    def _head(file_path: str, n: int, raw: Optional[bytes]) -> bytes:
+        """Primeros n bytes; raw puede ser el contenido o un prefijo de al menos n bytes."""
+        if raw is not None:
+            return raw[:n]
         with open(file_path, "rb") as f:
-            chunk = f.read(8192)
+            return f.read(n)
+
+    def _check_not_binary(self, file_path: str, raw: Optional[bytes] = None):
+        """Detecta si un archivo es binario (no texto)."""
+        chunk = self._head(file_path, 8192, raw)
         # Bytes nulos indican archivo binario
         null_count = chunk.count(b'\x00')
         if null_count > len(chunk) * 0.1:
             raise ValueError(f"El archivo parece ser binario, no un CSV: {file_path}")
 
-    def _detect_encoding(self, file_path: str) -> str:
-        sample_size = min(os.path.getsize(file_path), 100_000)
-        with open(file_path, "rb") as f:
-            raw = f.read(sample_size)
-        result = chardet.detect(raw)
+    def _detect_encoding(self, file_path: str, raw: Optional[bytes] = None) -> str:
+        sample = self._head(file_path, ENCODING_SAMPLE_BYTES, raw)
+        # Casos comunes sin el clasificador de chardet (mismos nombres que retornaría)
+        if sample.startswith(codecs.BOM_UTF8):
+            return "UTF-8-SIG"
+        if sample and sample.isascii():
+            return "latin-1"  # chardet: "ascii", normalizado abajo a latin-1
+        try:
+            # final=False: el corte de la muestra puede caer a mitad de un carácter multibyte
+            codecs.getincrementaldecoder("utf-8")().decode(sample, final=len(sample) < ENCODING_SAMPLE_BYTES)
+            return "utf-8"
+        except UnicodeDecodeError:
+            pass
+        result = chardet.detect(sample)
         encoding = result.get("encoding", "utf-8") or "utf-8"
         # Normalizar variantes comunes
         if encoding.lower() in ("ascii", "windows-1252", "iso-8859-1"):
             encoding = "latin-1"
         return encoding
 
-    def _detect_delimiter(self, file_path: str, encoding: str) -> str:
-        with open(file_path, "r", encoding=encoding, errors="replace") as f:
-            sample_lines = []
-            for i, line in enumerate(f):
-                if i >= 20:
-                    break
-                sample_lines.append(line)
+    def _detect_delimiter(self, file_path: str, encoding: str, raw: Optional[bytes] = None) -> str:
+        """Delimiter con la moda de columnas más alta en las primeras 20 líneas.
+
+        Los delimitadores son ASCII: se cuentan sobre los bytes, sin decodificar con encoding
+        (los archivos UTF-16/32 ya se rechazan como binarios).
+        """
+        # Muestra creciente: basta con que contenga 20 líneas completas (casi siempre la primera)
+        size = 4096
+        while True:
+            sample = self._head(file_path, size, raw)
+            # splitlines de bytes corta en \n, \r y \r\n, igual que la lectura en modo texto
+            sample_lines = sample.splitlines()
+            if len(sample_lines) > 20 or len(sample) < size or size >= DELIMITER_SAMPLE_BYTES:
+                break
+            size *= 4
+        if len(sample_lines) <= 20 and len(sample) == size and len(sample_lines) > 1:
+            sample_lines.pop()  # la última línea quedó cortada por el límite de bytes
+        sample_lines = sample_lines[:20]
+        lines = [line for line in sample_lines if line.strip()]
 
         if not sample_lines:
             return ","
@@ -114,7 +192,8 @@ class DataLoader:
         best_cols = 0
 
         for delim in DELIMITERS:
-            cols_per_line = [len(line.split(delim)) for line in sample_lines if line.strip()]
+            delim_byte = delim.encode("ascii")
+            cols_per_line = [line.count(delim_byte) + 1 for line in lines]
             if not cols_per_line:
                 continue
             # Usar la moda de columnas (la más frecuente)
@@ -5,19 +5,36 @@ Detecta: cambios de schema, shifts de distribución, cambios de cardinalidad,
 cambios de null rate, nuevas columnas, columnas eliminadas.
 """
 
-import json
 import logging
 from datetime import datetime
 from typing import Dict, List
 
-import numpy as np
 import pandas as pd
 from scipy import stats
 
+from core import json_output
 from core.data_loader import DataLoader
 
 logger = logging.getLogger(__name__)
 
+STATS_BLOCK_COLUMNS = 16  # Columnas por bloque al calcular null rate/cardinalidad/media/std
+
+
+def _is_text(s: pd.Series) -> bool:
+    """Columna de texto: object (pandas < 3) o str/StringDtype (por defecto en pandas >= 3)."""
+    return pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s)
+
+
+def _category_counts(s: pd.Series) -> pd.Series:
+    """Frecuencia de cada valor no nulo como string.
+
+    Una columna str ya tiene valores string y value_counts descarta los nulos:
+    se cuenta directamente, sin las copias de dropna/astype(str).
+    """
+    if isinstance(s.dtype, pd.StringDtype):
+        return s.value_counts()
+    return s.dropna().astype(str).value_counts()
+
 
 class DriftDetector:
     """Compara un dataset de referencia contra uno actual."""
@@ -58,23 +75,20 @@ class DriftDetector:
         return report
 
     def _schema_diff(self, ref_df, cur_df):
-        ref_cols = set(ref_df.columns)
-        cur_cols = set(cur_df.columns)
+        # dtypes de cada frame una sola vez (sin construir una Serie por columna)
+        ref_dtypes = {col: str(dtype) for col, dtype in ref_df.dtypes.items()}
+        cur_dtypes = {col: str(dtype) for col, dtype in cur_df.dtypes.items()}
+        ref_cols = ref_dtypes.keys()
+        cur_cols = cur_dtypes.keys()
 
         added = sorted(cur_cols - ref_cols)
         removed = sorted(ref_cols - cur_cols)
         common = sorted(ref_cols & cur_cols)
 
-        type_changed = []
-        for col in common:
-            ref_dtype = str(ref_df[col].dtype)
-            cur_dtype = str(cur_df[col].dtype)
-            if ref_dtype != cur_dtype:
-                type_changed.append({
-                    "column": col,
-                    "reference_dtype": ref_dtype,
-                    "current_dtype": cur_dtype,
-                })
+        type_changed = [
+            {"column": col, "reference_dtype": ref_dtypes[col], "current_dtype": cur_dtypes[col]}
+            for col in common if ref_dtypes[col] != cur_dtypes[col]
+        ]
 
         return {
             "added": added,
@@ -84,122 +98,153 @@ class DriftDetector:
         }
 
     def _column_drifts(self, ref_df, cur_df):
-        drifts = []
         common = sorted(set(ref_df.columns) & set(cur_df.columns))
 
-        for col in common:
-            drift = {"column": col, "has_drift": False, "tests": []}
+        numeric = [c for c in common
+                   if pd.api.types.is_numeric_dtype(ref_df[c]) and pd.api.types.is_numeric_dtype(cur_df[c])]
+        ref_stats = self._frame_stats(ref_df, common, numeric)
+        cur_stats = self._frame_stats(cur_df, common, numeric)
 
-            ref_s = ref_df[col]
-            cur_s = cur_df[col]
+        return [self._column_drift(col, ref_df[col], cur_df[col], ref_stats[col], cur_stats[col])
+                for col in common]
 
-            # Null rate change
-            ref_null = float(ref_s.isna().mean())
-            cur_null = float(cur_s.isna().mean())
-            null_change = abs(cur_null - ref_null)
-            if null_change > 0.05:
+    @staticmethod
+    def _frame_stats(df, common, numeric) -> Dict[str, Dict]:
+        """Null rate, cardinalidad y (columnas numéricas) media/std con reducciones por bloque.
+
+        Las reducciones de pandas ignoran NaN, igual que calcularlas sobre la serie sin nulos.
+        Se recorre en bloques de STATS_BLOCK_COLUMNS columnas: la máscara de isna() de un bloque
+        es pequeña y sigue en caché mientras se reduce (en vez de una máscara filas × columnas).
+        """
+        null_rates, nuniques, means, stds = {}, {}, {}, {}
+        numeric_set = set(numeric)
+        for start in range(0, len(common), STATS_BLOCK_COLUMNS):
+            block = df[common[start:start + STATS_BLOCK_COLUMNS]]
+            null_rates.update(block.isna().mean().to_dict())
+            nuniques.update(block.nunique().to_dict())
+            block_numeric = [col for col in block.columns if col in numeric_set]
+            if block_numeric:
+                means.update(block[block_numeric].mean().to_dict())
+                stds.update(block[block_numeric].std().to_dict())
+        return {
+            col: {"null_rate": null_rates[col], "nunique": nuniques[col],
+                  "mean": means.get(col), "std": stds.get(col)}
+            for col in common
+        }
+
+    def _column_drift(self, col, ref_s, cur_s, ref_stats, cur_stats) -> Dict:
+        """Tests de drift de una columna; los estadísticos de _frame_stats vienen precalculados."""
+        drift = {"column": col, "has_drift": False, "tests": []}
+
+        # Null rate change
+        ref_null = float(ref_stats["null_rate"])
+        cur_null = float(cur_stats["null_rate"])
+        null_change = abs(cur_null - ref_null)
+        if null_change > 0.05:
+            drift["tests"].append({
+                "test": "null_rate_change",
+                "reference": round(ref_null, 4),
+                "current": round(cur_null, 4),
+                "change": round(null_change, 4),
+                "significant": True,
+            })
+            drift["has_drift"] = True
+
+        # Numeric drift: KS test
+        if pd.api.types.is_numeric_dtype(ref_s) and pd.api.types.is_numeric_dtype(cur_s):
+            ref_num = pd.to_numeric(ref_s, errors="coerce").dropna()
+            cur_num = pd.to_numeric(cur_s, errors="coerce").dropna()
+            if len(ref_num) >= 10 and len(cur_num) >= 10:
+                ks_stat, ks_p = stats.ks_2samp(ref_num, cur_num)
+                significant = bool(ks_p < 0.01)
                 drift["tests"].append({
-                    "test": "null_rate_change",
-                    "reference": round(ref_null, 4),
-                    "current": round(cur_null, 4),
-                    "change": round(null_change, 4),
-                    "significant": True,
+                    "test": "ks_2sample",
+                    "statistic": round(float(ks_stat), 6),
+                    "p_value": round(float(ks_p), 6),
+                    "significant": significant,
                 })
-                drift["has_drift"] = True
+                if significant:
+                    drift["has_drift"] = True
+
+                # Mean/std change
+                ref_mean, cur_mean = float(ref_stats["mean"]), float(cur_stats["mean"])
+                ref_std, cur_std = float(ref_stats["std"]), float(cur_stats["std"])
+                drift["tests"].append({
+                    "test": "descriptive_change",
+                    "reference_mean": round(ref_mean, 4),
+                    "current_mean": round(cur_mean, 4),
+                    "reference_std": round(ref_std, 4),
+                    "current_std": round(cur_std, 4),
+                    "mean_change_pct": round(abs(cur_mean - ref_mean) / max(abs(ref_mean), 1e-10) * 100, 2),
+                })
+
+        # Categorical drift: chi-squared
+        elif _is_text(ref_s) or _is_text(cur_s):
+            ref_cats = _category_counts(ref_s)
+            cur_cats = _category_counts(cur_s)
+
+            # Unificar categorías (alineadas con reindex, sin .get por categoría)
+            ref_keys, cur_keys = set(ref_cats.index), set(cur_cats.index)
+            all_cats = sorted(ref_keys | cur_keys)
+            if len(all_cats) >= 2 and len(all_cats) <= 100:
+                ref_freq = ref_cats.reindex(all_cats, fill_value=0).to_numpy(dtype=float)
+                cur_freq = cur_cats.reindex(all_cats, fill_value=0).to_numpy(dtype=float)
+
+                # Normalizar
+                ref_freq = ref_freq / ref_freq.sum() if ref_freq.sum() > 0 else ref_freq
+                cur_freq = cur_freq / cur_freq.sum() if cur_freq.sum() > 0 else cur_freq
 
-            # Numeric drift: KS test
-            if pd.api.types.is_numeric_dtype(ref_s) and pd.api.types.is_numeric_dtype(cur_s):
-                ref_num = pd.to_numeric(ref_s, errors="coerce").dropna()
-                cur_num = pd.to_numeric(cur_s, errors="coerce").dropna()
-                if len(ref_num) >= 10 and len(cur_num) >= 10:
-                    ks_stat, ks_p = stats.ks_2samp(ref_num, cur_num)
-                    significant = ks_p < 0.01
-                    drift["tests"].append({
-                        "test": "ks_2sample",
-                        "statistic": round(float(ks_stat), 6),
-                        "p_value": round(float(ks_p), 6),
-                        "significant": significant,
-                    })
-                    if significant:
-                        drift["has_drift"] = True
-
-                    # Mean/std change
-                    ref_mean, cur_mean = float(ref_num.mean()), float(cur_num.mean())
-                    ref_std, cur_std = float(ref_num.std()), float(cur_num.std())
-                    drift["tests"].append({
-                        "test": "descriptive_change",
-                        "reference_mean": round(ref_mean, 4),
-                        "current_mean": round(cur_mean, 4),
-                        "reference_std": round(ref_std, 4),
-                        "current_std": round(cur_std, 4),
-                        "mean_change_pct": round(abs(cur_mean - ref_mean) / max(abs(ref_mean), 1e-10) * 100, 2),
-                    })
-
-            # Categorical drift: chi-squared
-            elif ref_s.dtype == "object" or cur_s.dtype == "object":
-                ref_cats = ref_s.dropna().astype(str).value_counts()
-                cur_cats = cur_s.dropna().astype(str).value_counts()
-
-                # Unificar categorías
-                all_cats = sorted(set(ref_cats.index) | set(cur_cats.index))
-                if len(all_cats) >= 2 and len(all_cats) <= 100:
-                    ref_freq = np.array([ref_cats.get(c, 0) for c in all_cats], dtype=float)
-                    cur_freq = np.array([cur_cats.get(c, 0) for c in all_cats], dtype=float)
-
-                    # Normalizar
-                    ref_freq = ref_freq / ref_freq.sum() if ref_freq.sum() > 0 else ref_freq
-                    cur_freq = cur_freq / cur_freq.sum() if cur_freq.sum() > 0 else cur_freq
-
-                    # Chi-squared test con frecuencias esperadas
-                    try:
-                        n_cur = len(cur_s.dropna())
-                        expected = ref_freq * n_cur
-                        observed = cur_freq * n_cur
-                        # Evitar expected == 0
-                        mask = expected > 0
-                        if mask.sum() >= 2:
-                            chi2, p = stats.chisquare(observed[mask], expected[mask])
-                            significant = p < 0.01
-                            drift["tests"].append({
-                                "test": "chi2_distribution",
-                                "statistic": round(float(chi2), 4),
-                                "p_value": round(float(p), 6),
-                                "significant": significant,
-                            })
-                            if significant:
-                                drift["has_drift"] = True
-                    except Exception as e:
-                        logger.warning("Chi-squared test falló para columna '%s': %s", col, e)
-
-                # Nuevas/eliminadas categorías
-                new_cats = set(cur_cats.index) - set(ref_cats.index)
-                removed_cats = set(ref_cats.index) - set(cur_cats.index)
-                if new_cats or removed_cats:
-                    drift["tests"].append({
-                        "test": "category_changes",
-                        "new_categories": sorted(new_cats)[:10],
-                        "removed_categories": sorted(removed_cats)[:10],
-                    })
-                    if len(new_cats) + len(removed_cats) > 3:
-                        drift["has_drift"] = True
-
-            # Cardinality change
-            ref_nunique = ref_s.nunique()
-            cur_nunique = cur_s.nunique()
-            if ref_nunique > 0:
-                cardinality_change = abs(cur_nunique - ref_nunique) / ref_nunique
-                if cardinality_change > 0.2:
-                    drift["tests"].append({
-                        "test": "cardinality_change",
-                        "reference": int(ref_nunique),
-                        "current": int(cur_nunique),
-                        "change_pct": round(cardinality_change * 100, 2),
-                    })
+                # Chi-squared test con frecuencias esperadas
+                try:
+                    n_cur = int(cur_cats.sum())  # = no nulos de cur_s
+                    expected = ref_freq * n_cur
+                    observed = cur_freq * n_cur
+                    # Evitar expected == 0
+                    mask = expected > 0
+                    if mask.sum() >= 2:
+                        chi2, p = stats.chisquare(observed[mask], expected[mask])
+                        significant = bool(p < 0.01)
+                        drift["tests"].append({
+                            "test": "chi2_distribution",
+                            "statistic": round(float(chi2), 4),
+                            "p_value": round(float(p), 6),
+                            "significant": significant,
+                        })
+                        if significant:
+                            drift["has_drift"] = True
+                except Exception as e:
+                    logger.warning("Chi-squared test falló para columna '%s': %s", col, e)
+
+            # Nuevas/eliminadas categorías
+            new_cats = cur_keys - ref_keys
+            removed_cats = ref_keys - cur_keys
+            if new_cats or removed_cats:
+                drift["tests"].append({
+                    "test": "category_changes",
+                    "new_categories": sorted(new_cats)[:10],
+                    "removed_categories": sorted(removed_cats)[:10],
+                })
+                if len(new_cats) + len(removed_cats) > 3:
                     drift["has_drift"] = True
 
-            drifts.append(drift)
+        # Cardinality change
+        ref_nunique, cur_nunique = ref_stats["nunique"], cur_stats["nunique"]
+        if ref_nunique > 0:
+            cardinality_change = abs(cur_nunique - ref_nunique) / ref_nunique
+            if cardinality_change > 0.2:
+                drift["tests"].append({
+                    "test": "cardinality_change",
+                    "reference": int(ref_nunique),
+                    "current": int(cur_nunique),
+                    "change_pct": round(cardinality_change * 100, 2),
+                })
+                drift["has_drift"] = True
+
+        return drift
 
-        return drifts
+    def to_json(self, report: Dict, output_path: str):
+        """Escribe el reporte de drift como JSON indentado."""
+        json_output.dump(report, output_path)
 
     def print_summary(self, report):
         """Imprime resumen de drift a stdout."""
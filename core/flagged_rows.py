@@ -8,10 +8,24 @@ from typing import List, Dict, Optional
 import pandas as pd
 import numpy as np
 
+from utils.unique_values import apply_via_categories
 from models.check_result import CheckResult
 from models.semantic_type import SemanticType
 
 
+FLAG_COLUMNS = ("row_number", "column", "check_id", "severity", "value", "detail")
+# Orden de severidad del CSV; severidades desconocidas van al final
+SEVERITY_RANK = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "INFO": 4}
+
+
+def _has_edge_whitespace(values: pd.Series) -> np.ndarray:
+    """True para strings con espacios leading/trailing que no son solo espacios."""
+    return np.fromiter(
+        (isinstance(v, str) and v != (t := v.strip()) and t != "" for v in values),
+        dtype=bool, count=len(values),
+    )
+
+
 class FlaggedRowsExporter:
     """Identifica y exporta filas problemáticas a un CSV auxiliar."""
 
@@ -23,9 +37,13 @@ class FlaggedRowsExporter:
         column_types: Dict[str, SemanticType],
     ) -> pd.DataFrame:
         """Recolecta filas con problemas detectados. Retorna DataFrame de flags."""
-        flags = []  # list of dicts: {row, column, check_id, severity, detail}
+        # Columnas del resultado como listas paralelas (una entrada por fila flaggeada)
+        flags = {name: [] for name in FLAG_COLUMNS}
+        severity_ranks = []
 
         n_rows = len(df)
+        # Conversiones por columna compartidas entre checks (p.ej. los tres OUTLIER_*)
+        conversions = {}
 
         for r in results:
             if r.passed or r.column == "__dataset__":
@@ -35,28 +53,31 @@ class FlaggedRowsExporter:
             if col not in df.columns:
                 continue
 
-            row_indices = self._get_flagged_indices(r, df_raw, df, col)
-
-            for idx in row_indices:
-                if 0 <= idx < n_rows:
-                    flags.append({
-                        "row_number": idx + 1,  # 1-based
-                        "column": col,
-                        "check_id": r.check_id,
-                        "severity": r.severity,
-                        "value": str(df_raw[col].iloc[idx]) if col in df_raw.columns else "",
-                        "detail": r.message[:200],
-                    })
-
-        if not flags:
-            return pd.DataFrame(columns=["row_number", "column", "check_id", "severity", "value", "detail"])
-
-        flag_df = pd.DataFrame(flags)
-        flag_df = flag_df.sort_values(
-            ["severity", "row_number"],
-            key=lambda x: x.map({"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "INFO": 4})
-            if x.name == "severity" else x
-        ).reset_index(drop=True)
+            row_indices = [idx for idx in self._get_flagged_indices(r, df_raw, df, col, conversions)
+                           if 0 <= idx < n_rows]
+            if not row_indices:
+                continue
+
+            if col in df_raw.columns:
+                # Una sola selección por resultado en vez de df_raw[col].iloc[idx] por fila
+                values = [str(v) for v in df_raw[col].iloc[row_indices]]
+            else:
+                values = [""] * len(row_indices)
+            count = len(row_indices)
+            flags["row_number"].extend(idx + 1 for idx in row_indices)  # 1-based
+            flags["column"].extend([col] * count)
+            flags["check_id"].extend([r.check_id] * count)
+            flags["severity"].extend([r.severity] * count)
+            flags["value"].extend(values)
+            flags["detail"].extend([r.message[:200]] * count)
+            severity_ranks.extend([SEVERITY_RANK.get(r.severity, len(SEVERITY_RANK))] * count)
+
+        if not severity_ranks:
+            return pd.DataFrame(columns=list(FLAG_COLUMNS))
+
+        # Orden por severidad (rank entero precalculado) y fila; lexsort estable como sort_values
+        order = np.lexsort((np.array(flags["row_number"]), np.array(severity_ranks)))
+        flag_df = pd.DataFrame(flags).take(order).reset_index(drop=True)
 
         return flag_df
 
@@ -74,8 +95,12 @@ class FlaggedRowsExporter:
         df_raw: pd.DataFrame,
         df: pd.DataFrame,
         col: str,
+        conversions: Optional[Dict] = None,
     ) -> List[int]:
-        """Obtiene los índices de filas problemáticas para un check específico."""
+        """Obtiene los índices de filas problemáticas para un check específico.
+
+        conversions: memo {(tipo, columna): valores convertidos} reutilizado entre llamadas.
+        """
 
         # Si el resultado ya tiene índices en metadata
         if "violation_indices" in result.metadata:
@@ -92,53 +117,82 @@ class FlaggedRowsExporter:
 
         # Nulls
         if check_id == "NULL_RATE":
-            return series[series.isna()].index.tolist()[:100]
+            return series.index[np.flatnonzero(series.isna().to_numpy())[:100]].tolist()
 
         # Duplicates
         if check_id == "DUPLICATE_ROWS":
-            dups = df_raw.duplicated(keep="first")
-            return dups[dups].index.tolist()[:100]
+            dups = df_raw.duplicated(keep="first").to_numpy()
+            return df_raw.index[np.flatnonzero(dups)[:100]].tolist()
 
-        # Outliers IQR
+        # Outliers: máscaras sobre el ndarray float (NaN = nulo o no numérico, nunca se marca)
         if check_id in ("OUTLIER_IQR", "OUTLIER_ZSCORE", "OUTLIER_MODIFIED_Z"):
-            s = pd.to_numeric(series, errors="coerce").dropna()
-            if len(s) > 0:
-                if check_id == "OUTLIER_IQR":
-                    q1, q3 = s.quantile(0.25), s.quantile(0.75)
-                    iqr = q3 - q1
-                    if iqr > 0:
-                        mask = (s < q1 - 1.5 * iqr) | (s > q3 + 1.5 * iqr)
-                        return s[mask].index.tolist()[:100]
-                elif check_id == "OUTLIER_ZSCORE":
-                    z = (s - s.mean()) / s.std()
-                    return s[z.abs() > 3].index.tolist()[:100]
-                elif check_id == "OUTLIER_MODIFIED_Z":
-                    median = s.median()
-                    mad = (s - median).abs().median()
-                    if mad > 0:
-                        mz = 0.6745 * (s - median) / mad
-                        return s[mz.abs() > 3.5].index.tolist()[:100]
+            vals = self._as_float(series, conversions)
+            valid = vals[~np.isnan(vals)]
+            mask = None
+            if check_id == "OUTLIER_IQR" and len(valid) > 0:
+                q1, q3 = np.percentile(valid, [25, 75])
+                iqr = q3 - q1
+                if iqr > 0:
+                    mask = (vals < q1 - 1.5 * iqr) | (vals > q3 + 1.5 * iqr)
+            elif check_id == "OUTLIER_ZSCORE" and len(valid) > 1:
+                # ddof=1 como Series.std; std == 0 da inf/NaN y ninguna fila supera el umbral
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    z = (vals - valid.mean()) / valid.std(ddof=1)
+                mask = np.abs(z) > 3
+            elif check_id == "OUTLIER_MODIFIED_Z" and len(valid) > 0:
+                median = np.median(valid)
+                mad = np.median(np.abs(valid - median))
+                if mad > 0:
+                    mask = np.abs(0.6745 * (vals - median) / mad) > 3.5
+            if mask is not None:
+                return series.index[np.flatnonzero(mask)[:100]].tolist()
 
         # Whitespace
         if check_id == "WHITESPACE_ISSUES" and series_raw is not None:
-            mask = series_raw.astype(str).apply(lambda x: x != x.strip() and x.strip() != "")
-            return series_raw[mask].index.tolist()[:100]
+            # Predicado evaluado por valor único (columnas de baja cardinalidad, lo habitual)
+            mask = apply_via_categories(series_raw.astype(str), _has_edge_whitespace)
+            return series_raw.index[np.flatnonzero(mask.to_numpy(dtype=bool))[:100]].tolist()
 
         # Date future / ancient
-        if check_id == "DATE_FUTURE":
-            dt = pd.to_datetime(series, errors="coerce")
-            future = dt[dt > pd.Timestamp.now()]
-            return future.index.tolist()[:100]
-
-        if check_id == "DATE_ANCIENT":
-            dt = pd.to_datetime(series, errors="coerce")
-            ancient = dt[dt < pd.Timestamp("1900-01-01")]
-            return ancient.index.tolist()[:100]
+        if check_id in ("DATE_FUTURE", "DATE_ANCIENT"):
+            dt = self._as_datetime(series, conversions)
+            future = check_id == "DATE_FUTURE"
+            bound = pd.Timestamp.now() if future else pd.Timestamp("1900-01-01")
+            if isinstance(dt.dtype, np.dtype):
+                # datetime64 naive: comparación numpy en la unidad de la columna (sin pasar a ns,
+                # que desborda antes de 1677); NaT compara False
+                vals, bound = dt.to_numpy(), np.datetime64(bound)
+            else:
+                vals = dt  # con zona horaria: comparación de pandas
+            mask = vals > bound if future else vals < bound
+            return series.index[np.flatnonzero(np.asarray(mask, dtype=bool))[:100]].tolist()
 
         # Negative values
         if check_id == "NEGATIVE_VALUES":
-            s = pd.to_numeric(series, errors="coerce")
-            return s[s < 0].index.tolist()[:100]
+            vals = self._as_float(series, conversions)
+            return series.index[np.flatnonzero(vals < 0)[:100]].tolist()
 
         # Generic: si hay affected_count pero no podemos identificar filas exactas
         return []
+
+    @staticmethod
+    def _as_float(series: pd.Series, conversions: Optional[Dict]) -> np.ndarray:
+        """Columna como ndarray float64 (NaN = nulo o no numérico), convertida una vez."""
+        key = ("float", series.name)
+        if conversions is not None and key in conversions:
+            return conversions[key]
+        vals = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        if conversions is not None:
+            conversions[key] = vals
+        return vals
+
+    @staticmethod
+    def _as_datetime(series: pd.Series, conversions: Optional[Dict]) -> pd.Series:
+        """Columna parseada con pd.to_datetime(errors="coerce"), una vez por columna."""
+        key = ("datetime", series.name)
+        if conversions is not None and key in conversions:
+            return conversions[key]
+        dt = pd.to_datetime(series, errors="coerce")
+        if conversions is not None:
+            conversions[key] = dt
+        return dt
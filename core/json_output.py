@@ -0,0 +1,65 @@
+"""
+Serialización JSON de reportes: usa orjson si está instalado y, si no, el json estándar
+con la misma salida (escalares numpy nativos, fechas ISO 8601, NaN/inf como null).
+"""
+
+import json
+import math
+from datetime import date, datetime
+
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if HAS_ORJSON else 0
+)
+
+_NATIVE_KEY_TYPES = (str, int, float, bool)
+
+
+def _finite(obj):
+    """Recorre dicts/listas dejando solo valores que el json estándar escribe como orjson."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {
+            (k if k is None or isinstance(k, _NATIVE_KEY_TYPES) else str(_json_default(k))): _finite(v)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    return obj
+
+
+def _json_default(obj):
+    """Tipos que ninguno de los dos serializadores conoce; ambos usan esta misma función."""
+    if isinstance(obj, (datetime, date)):  # incluye pd.Timestamp
+        return obj.isoformat()
+    if isinstance(obj, np.ndarray):
+        return _finite(obj.tolist())
+    if isinstance(obj, np.generic):
+        return _finite(obj.item())
+    return str(obj)
+
+
+def dumps(obj) -> bytes:
+    """obj como JSON indentado en UTF-8."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS, default=_json_default)
+        except TypeError:
+            # p.ej. enteros fuera de 64 bits: se delega al json estándar
+            pass
+    return json.dumps(_finite(obj), ensure_ascii=False, indent=2, default=_json_default).encode("utf-8")
+
+
+def dump(obj, output_path: str):
+    """Escribe obj como JSON indentado en output_path."""
+    with open(output_path, "wb") as f:
+        f.write(dumps(obj))
@@ -11,6 +11,7 @@ Formato YAML (en schema):
 
 from typing import List, Dict, Any, Optional
 
+import numpy as np
 import pandas as pd
 
 from models.check_result import CheckResult
@@ -90,10 +91,13 @@ class ReferentialIntegrityChecker:
 
             # Validar referential integrity
             child_values = child_df[child_col].dropna().unique()
-            parent_values = set(parent_df[parent_col].dropna().unique())
+            parent_values = parent_df[parent_col].dropna().unique()
 
-            orphans = [v for v in child_values if v not in parent_values]
-            orphan_count = len(orphans)
+            # Pertenencia con hash vectorizado (misma igualdad que un set: 10 == 10.0, "10" != 10)
+            orphan_mask = ~pd.Index(child_values).isin(parent_values)
+            orphan_count = int(orphan_mask.sum())
+            # Solo los 10 primeros huérfanos van a sample_values: no se copia el resto
+            orphan_samples = child_values[np.flatnonzero(orphan_mask)[:10]]
             total = len(child_values)
             orphan_pct = orphan_count / total if total > 0 else 0.0
 
@@ -115,7 +119,7 @@ class ReferentialIntegrityChecker:
                         f"{orphan_count:,} valores huérfanos de {total:,} ({orphan_pct:.1%})",
                 affected_count=orphan_count,
                 affected_pct=orphan_pct,
-                sample_values=[str(v) for v in orphans[:10]],
+                sample_values=[str(v) for v in orphan_samples],
                 metadata={
                     "child_table": child_table,
                     "child_column": child_col,
@@ -1,13 +1,13 @@
-import json
 import logging
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 import pandas as pd
 import numpy as np
 
 from models.semantic_type import SemanticType
 from models.check_result import CheckResult
+from core import json_output
 from core.check_descriptions import (
     friendly_title, business_impact, friendly_type, severity_short,
     SEVERITY_EMOJI,
@@ -15,6 +15,69 @@ from core.check_descriptions import (
 
 logger = logging.getLogger(__name__)
 
+# Percentiles del profiling; el summary toma Q1/Q3 de la misma tabla
+PROFILE_QUANTILES = (0.01, 0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95, 0.99)
+_Q1_POS, _Q3_POS = PROFILE_QUANTILES.index(0.25), PROFILE_QUANTILES.index(0.75)
+
+# Orden de severidad de hallazgos y recomendaciones (menor = más grave)
+SEVERITY_RANK = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "INFO": 4}
+
+# Acción recomendada por check_id; los demás usan un texto genérico con título y columna
+RECOMMENDED_ACTIONS = {
+    "NULL_RATE": "Investigar fuente de nulos; evaluar imputacion o exclusion",
+    "DUPLICATE_ROWS": "Eliminar filas duplicadas o investigar origen",
+    "OUTLIER_IQR": "Revisar outliers: errores de captura o valores legitimos extremos",
+    "OUTLIER_ZSCORE": "Revisar outliers por Z-score: posibles errores de medicion",
+    "OUTLIER_MODIFIED_Z": "Revisar outliers robustos: distribución sesgada con valores extremos",
+    "DISTRIBUTION_SKEW": "Evaluar si la asimetria afecta el analisis; considerar transformacion",
+    "DISTRIBUTION_KURTOSIS": "Distribución con colas pesadas; verificar valores extremos",
+    "TREND_CHANGE": "Investigar cambio de tendencia: posible evento externo o error de pipeline",
+    "DATE_FORMAT_MIX": "Estandarizar formato de fecha a ISO 8601",
+    "DATE_FUTURE": "Verificar fechas futuras: posible error de captura",
+    "DATE_ANCIENT": "Verificar fechas anteriores a 1900: posible error de dato",
+    "ID_DUPLICATES": "IDs duplicados: verificar integridad referencial",
+    "ID_NULL": "IDs nulos: critico para integridad de datos",
+    "CASE_INCONSISTENCY": "Normalizar capitalización de categorías",
+    "TYPO_CANDIDATES": "Revisar categorías similares: posibles errores tipográficos",
+    "EMAIL_FORMAT": "Validar y corregir formato de emails",
+    "PHONE_FORMAT": "Estandarizar formato de teléfonos",
+    "TEMPORAL_DRIFT": "Investigar cambio en distribución temporal",
+    "CLASS_IMBALANCE": "Verificar si el desbalance de clases es esperado",
+    "WHITESPACE_ISSUES": "Aplicar trim a valores con espacios leading/trailing",
+}
+
+# Categoría de cada check en las recomendaciones ("General" si no está)
+CHECK_CATEGORIES = {
+    "NULL_RATE": "Missing Data",
+    "DUPLICATE_ROWS": "Duplicados",
+    "WHITESPACE_ISSUES": "Formato",
+    "CONSTANT_COLUMN": "Relevancia",
+    "NEAR_CONSTANT": "Relevancia",
+    "OUTLIER_IQR": "Outliers",
+    "OUTLIER_ZSCORE": "Outliers",
+    "OUTLIER_MODIFIED_Z": "Outliers",
+    "DISTRIBUTION_SKEW": "Distribución",
+    "DISTRIBUTION_KURTOSIS": "Distribución",
+    "NEGATIVE_VALUES": "Rango",
+    "ZERO_VALUES": "Rango",
+    "TREND_CHANGE": "Tendencia",
+    "VARIANCE_SUDDEN_CHANGE": "Tendencia",
+    "DATE_FORMAT_MIX": "Formato Fecha",
+    "DATE_FUTURE": "Validez Fecha",
+    "DATE_ANCIENT": "Validez Fecha",
+    "DATE_SEQUENCE_GAPS": "Continuidad Temporal",
+    "TEMPORAL_DRIFT": "Drift",
+    "RARE_CATEGORIES": "Categorías",
+    "CASE_INCONSISTENCY": "Formato Categorías",
+    "TYPO_CANDIDATES": "Calidad Categorías",
+    "CLASS_IMBALANCE": "Balance",
+    "EMAIL_FORMAT": "Formato Contacto",
+    "PHONE_FORMAT": "Formato Contacto",
+    "ID_DUPLICATES": "Integridad ID",
+    "ID_NULL": "Integridad ID",
+    "ID_FORMAT_CONSISTENCY": "Formato ID",
+}
+
 
 class ReportBuilder:
     """Capa 6: Genera reporte estandarizado JSON + texto."""
@@ -28,6 +91,15 @@ class ReportBuilder:
         df: pd.DataFrame,
     ) -> Dict:
         """Construye el reporte completo como dict (serializable a JSON)."""
+        # Una sola pasada sobre results: agrupados por columna y los fallidos (issues y recomendaciones)
+        results_by_col: Dict[str, List[CheckResult]] = {}
+        failed: List[CheckResult] = []
+        for r in results:
+            results_by_col.setdefault(r.column, []).append(r)
+            if not r.passed:
+                failed.append(r)
+        # Columnas numéricas convertidas (y sus percentiles) una sola vez: las usan el summary y el profiling
+        numeric_cache: Dict[str, Tuple] = {}
         report = {
             "report_metadata": {
                 "generated_at": datetime.now().isoformat(),
@@ -46,19 +118,18 @@ class ReportBuilder:
                 "clean_columns": self._get_clean_columns(scoring),
             },
             "column_profiles": self._build_column_profiles(
-                results, scoring, column_types, df
+                results_by_col, scoring, column_types, df
             ),
-            "critical_issues": self._get_critical_issues(results),
-            "recommendations": self._build_recommendations(results),
-            "statistical_summary": self._build_statistical_summary(df, column_types),
-            "column_profiling": self._build_column_profiling(df, column_types),
+            "critical_issues": self._get_critical_issues(failed),
+            "recommendations": self._build_recommendations(failed),
+            "statistical_summary": self._build_statistical_summary(df, column_types, numeric_cache),
+            "column_profiling": self._build_column_profiling(df, column_types, numeric_cache),
         }
         return report
 
     def to_json(self, report: Dict, output_path: str):
-        """Escribe el reporte como JSON."""
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+        """Escribe el reporte como JSON indentado."""
+        json_output.dump(report, output_path)
 
     def to_text(self, report: Dict, output_path: Optional[str] = None) -> str:
         """Genera el reporte formateado como texto. Si output_path, lo escribe a archivo."""
@@ -158,29 +229,25 @@ class ReportBuilder:
         ]
 
     def _build_column_profiles(
-        self, results, scoring, column_types, df
+        self, results_by_col, scoring, column_types, df
     ) -> Dict:
+        """Perfil por columna; results_by_col: {columna: [CheckResult]} armado en build()."""
         profiles = {}
-        results_by_col = {}
-        for r in results:
-            results_by_col.setdefault(r.column, []).append(r)
-
         for col, sem_type in column_types.items():
             col_score = scoring["column_scores"].get(col, {"score": 100, "grade": "A", "checks_run": 0, "checks_failed": 0})
             col_results = results_by_col.get(col, [])
             failed_issues = [r.to_dict() for r in col_results if not r.passed]
 
-            null_pct = 0.0
+            null_pct, n_unique, pandas_dtype = 0.0, 0, "unknown"
             if col in df.columns:
-                null_pct = float(df[col].isna().mean())
-
-            n_unique = 0
-            if col in df.columns:
-                n_unique = int(df[col].nunique())
+                series = df[col]
+                null_pct = float(series.isna().mean())
+                n_unique = int(series.nunique())
+                pandas_dtype = str(series.dtype)
 
             profiles[col] = {
                 "semantic_type": sem_type.value,
-                "pandas_dtype": str(df[col].dtype) if col in df.columns else "unknown",
+                "pandas_dtype": pandas_dtype,
                 "n_unique": n_unique,
                 "null_pct": round(null_pct, 4),
                 "health_score": col_score["score"],
@@ -192,16 +259,15 @@ class ReportBuilder:
         return profiles
 
     def _get_critical_issues(self, results: List[CheckResult]) -> List[Dict]:
-        critical = [r for r in results if r.severity in ("CRITICAL", "HIGH") and not r.passed]
-        critical.sort(key=lambda r: {"CRITICAL": 0, "HIGH": 1}.get(r.severity, 2))
-        return [r.to_dict() for r in critical]
+        # Partición estable en dos pasadas: mismo orden que un sort estable por severidad
+        failed = [r for r in results if not r.passed]
+        return ([r.to_dict() for r in failed if r.severity == "CRITICAL"]
+                + [r.to_dict() for r in failed if r.severity == "HIGH"])
 
     def _build_recommendations(self, results: List[CheckResult]) -> List[Dict]:
         recs = []
-        severity_priority = {"CRITICAL": 1, "HIGH": 2, "MEDIUM": 3, "LOW": 4}
-
-        failed = [r for r in results if not r.passed and r.severity in severity_priority]
-        failed.sort(key=lambda r: severity_priority.get(r.severity, 5))
+        failed = [r for r in results if not r.passed and r.severity in ("CRITICAL", "HIGH", "MEDIUM", "LOW")]
+        failed.sort(key=lambda r: SEVERITY_RANK[r.severity])
 
         seen = set()
         for r in failed:
@@ -225,171 +291,151 @@ class ReportBuilder:
         return recs
 
     def _recommend_action(self, result: CheckResult) -> str:
-        actions = {
-            "NULL_RATE": "Investigar fuente de nulos; evaluar imputacion o exclusion",
-            "DUPLICATE_ROWS": "Eliminar filas duplicadas o investigar origen",
-            "OUTLIER_IQR": "Revisar outliers: errores de captura o valores legitimos extremos",
-            "OUTLIER_ZSCORE": "Revisar outliers por Z-score: posibles errores de medicion",
-            "OUTLIER_MODIFIED_Z": "Revisar outliers robustos: distribución sesgada con valores extremos",
-            "DISTRIBUTION_SKEW": "Evaluar si la asimetria afecta el analisis; considerar transformacion",
-            "DISTRIBUTION_KURTOSIS": "Distribución con colas pesadas; verificar valores extremos",
-            "TREND_CHANGE": "Investigar cambio de tendencia: posible evento externo o error de pipeline",
-            "DATE_FORMAT_MIX": "Estandarizar formato de fecha a ISO 8601",
-            "DATE_FUTURE": "Verificar fechas futuras: posible error de captura",
-            "DATE_ANCIENT": "Verificar fechas anteriores a 1900: posible error de dato",
-            "ID_DUPLICATES": "IDs duplicados: verificar integridad referencial",
-            "ID_NULL": "IDs nulos: critico para integridad de datos",
-            "CASE_INCONSISTENCY": "Normalizar capitalización de categorías",
-            "TYPO_CANDIDATES": "Revisar categorías similares: posibles errores tipográficos",
-            "EMAIL_FORMAT": "Validar y corregir formato de emails",
-            "PHONE_FORMAT": "Estandarizar formato de teléfonos",
-            "TEMPORAL_DRIFT": "Investigar cambio en distribución temporal",
-            "CLASS_IMBALANCE": "Verificar si el desbalance de clases es esperado",
-            "WHITESPACE_ISSUES": "Aplicar trim a valores con espacios leading/trailing",
-        }
-        fallback = f"Revisar: {friendly_title(result.check_id)} en columna {result.column}"
-        return actions.get(result.check_id, fallback)
+        action = RECOMMENDED_ACTIONS.get(result.check_id)
+        if action is None:
+            action = f"Revisar: {friendly_title(result.check_id)} en columna {result.column}"
+        return action
 
     def _categorize_check(self, check_id: str) -> str:
-        categories = {
-            "NULL_RATE": "Missing Data",
-            "DUPLICATE_ROWS": "Duplicados",
-            "WHITESPACE_ISSUES": "Formato",
-            "CONSTANT_COLUMN": "Relevancia",
-            "NEAR_CONSTANT": "Relevancia",
-            "OUTLIER_IQR": "Outliers",
-            "OUTLIER_ZSCORE": "Outliers",
-            "OUTLIER_MODIFIED_Z": "Outliers",
-            "DISTRIBUTION_SKEW": "Distribución",
-            "DISTRIBUTION_KURTOSIS": "Distribución",
-            "NEGATIVE_VALUES": "Rango",
-            "ZERO_VALUES": "Rango",
-            "TREND_CHANGE": "Tendencia",
-            "VARIANCE_SUDDEN_CHANGE": "Tendencia",
-            "DATE_FORMAT_MIX": "Formato Fecha",
-            "DATE_FUTURE": "Validez Fecha",
-            "DATE_ANCIENT": "Validez Fecha",
-            "DATE_SEQUENCE_GAPS": "Continuidad Temporal",
-            "TEMPORAL_DRIFT": "Drift",
-            "RARE_CATEGORIES": "Categorías",
-            "CASE_INCONSISTENCY": "Formato Categorías",
-            "TYPO_CANDIDATES": "Calidad Categorías",
-            "CLASS_IMBALANCE": "Balance",
-            "EMAIL_FORMAT": "Formato Contacto",
-            "PHONE_FORMAT": "Formato Contacto",
-            "ID_DUPLICATES": "Integridad ID",
-            "ID_NULL": "Integridad ID",
-            "ID_FORMAT_CONSISTENCY": "Formato ID",
-        }
-        return categories.get(check_id, "General")
-
-    def _build_statistical_summary(self, df: pd.DataFrame, column_types: Dict[str, SemanticType]) -> Dict:
+        return CHECK_CATEGORIES.get(check_id, "General")
+
+    @staticmethod
+    def _numeric_values(df: pd.DataFrame, col: str, numeric_cache: Optional[Dict[str, Tuple]]) -> Tuple:
+        """(serie no nula, ndarray float64, PROFILE_QUANTILES) de la columna, una vez por reporte.
+
+        Los percentiles salen de una sola selección (np.quantile con la lista), igual que
+        Series.quantile; con la columna vacía son None.
+        """
+        if numeric_cache is not None and col in numeric_cache:
+            return numeric_cache[col]
+        s = pd.to_numeric(df[col], errors="coerce").dropna()
+        vals = s.to_numpy(dtype=np.float64)
+        quantiles = np.quantile(vals, PROFILE_QUANTILES) if len(vals) > 0 else None
+        entry = (s, vals, quantiles)
+        if numeric_cache is not None:
+            numeric_cache[col] = entry
+        return entry
+
+    @staticmethod
+    def _map_columns(func, df: pd.DataFrame, column_types: Dict[str, SemanticType],
+                     numeric_cache: Optional[Dict[str, Tuple]]) -> List[Tuple[str, object]]:
+        """[(columna, func(columna, tipo, df, numeric_cache))] en el orden de column_types.
+
+        Solo columnas presentes en df.
+        """
+        return [(col, func(col, sem_type, df, numeric_cache))
+                for col, sem_type in column_types.items() if col in df.columns]
+
+    def _build_statistical_summary(self, df: pd.DataFrame, column_types: Dict[str, SemanticType],
+                                   numeric_cache: Optional[Dict[str, Tuple]] = None) -> Dict:
         summary: Dict = {"numeric_columns": {}, "categorical_columns": {}, "date_columns": {}}
-
-        for col, sem_type in column_types.items():
-            if col not in df.columns:
-                continue
-
-            if sem_type in (SemanticType.NUMERIC_CONTINUOUS, SemanticType.NUMERIC_DISCRETE):
-                s = pd.to_numeric(df[col], errors="coerce").dropna()
-                if len(s) > 0:
-                    q1, q3 = s.quantile(0.25), s.quantile(0.75)
-                    iqr = q3 - q1
-                    outlier_iqr = int(((s < q1 - 1.5 * iqr) | (s > q3 + 1.5 * iqr)).sum()) if iqr > 0 else 0
-                    mean, std = s.mean(), s.std()
-                    outlier_z = int((((s - mean) / std).abs() > 3).sum()) if std > 0 else 0
-
-                    summary["numeric_columns"][col] = {
-                        "mean": round(float(s.mean()), 4),
-                        "median": round(float(s.median()), 4),
-                        "std": round(float(s.std()), 4),
-                        "min": round(float(s.min()), 4),
-                        "max": round(float(s.max()), 4),
-                        "skewness": round(float(s.skew()), 4),
-                        "kurtosis": round(float(s.kurtosis()), 4),
-                        "outlier_count_iqr": outlier_iqr,
-                        "outlier_count_zscore": outlier_z,
-                    }
-
-            elif sem_type in (SemanticType.CATEGORICAL, SemanticType.BOOLEAN):
-                non_null = df[col].dropna()
-                if len(non_null) > 0:
-                    vc = non_null.value_counts()
-                    rare = vc[vc / len(non_null) < 0.005]
-                    summary["categorical_columns"][col] = {
-                        "n_unique": int(non_null.nunique()),
-                        "top_value": str(vc.index[0]),
-                        "top_freq": round(float(vc.iloc[0] / len(non_null)), 4),
-                        "rare_categories": [str(c) for c in rare.index[:10]],
-                    }
-
-            elif sem_type in (SemanticType.DATE, SemanticType.DATETIME):
-                dt = pd.to_datetime(df[col], errors="coerce").dropna()
-                if len(dt) > 0:
-                    diffs = dt.sort_values().diff().dropna()
-                    gap_count = 0
-                    if len(diffs) > 0:
-                        median_diff = diffs.median()
-                        if median_diff > pd.Timedelta(0):
-                            gap_count = int((diffs > 3 * median_diff).sum())
-
-                    summary["date_columns"][col] = {
-                        "min_date": str(dt.min()),
-                        "max_date": str(dt.max()),
-                        "formats_found": [],  # Populated by DATE_FORMAT_MIX check
-                        "gap_count": gap_count,
-                    }
-
+        for col, entry in self._map_columns(self._column_statistics, df, column_types, numeric_cache):
+            if entry is not None:
+                section, stats = entry
+                summary[section][col] = stats
         return summary
 
-    def _build_column_profiling(self, df: pd.DataFrame, column_types: Dict[str, SemanticType]) -> Dict:
-        """Profiling detallado por columna: percentiles, histograma textual, top valores, CV."""
-        profiling = {}
-
-        for col, sem_type in column_types.items():
-            if col not in df.columns:
-                continue
-
-            profile = {}
-
-            if sem_type in (SemanticType.NUMERIC_CONTINUOUS, SemanticType.NUMERIC_DISCRETE):
-                s = pd.to_numeric(df[col], errors="coerce").dropna()
-                if len(s) > 0:
-                    pcts = s.quantile([0.01, 0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95, 0.99])
-                    profile["percentiles"] = {
-                        f"p{int(k*100)}": round(float(v), 4) for k, v in pcts.items()
-                    }
-                    q1, q3 = s.quantile(0.25), s.quantile(0.75)
-                    profile["iqr"] = round(float(q3 - q1), 4)
-                    mean = s.mean()
-                    std = s.std()
-                    profile["cv"] = round(float(std / mean), 4) if mean != 0 else None
-
-                    # Histograma textual (10 bins)
-                    try:
-                        counts, edges = np.histogram(s, bins=10)
-                        max_count = max(counts) if len(counts) > 0 else 1
-                        hist = []
-                        for i, c in enumerate(counts):
-                            bar_len = int(20 * c / max_count) if max_count > 0 else 0
-                            hist.append({
-                                "range": f"{edges[i]:.2f}-{edges[i+1]:.2f}",
-                                "count": int(c),
-                                "bar": "█" * bar_len,
-                            })
-                        profile["histogram"] = hist
-                    except Exception as e:
-                        logger.debug("No se pudo generar histograma para '%s': %s", col, e)
-
-            # Top valores (para cualquier tipo)
+    def _column_statistics(self, col: str, sem_type: SemanticType, df: pd.DataFrame,
+                           numeric_cache: Optional[Dict[str, Tuple]]) -> Optional[Tuple[str, Dict]]:
+        """(sección del statistical_summary, estadísticos) de una columna; None si no aplica."""
+        if sem_type in (SemanticType.NUMERIC_CONTINUOUS, SemanticType.NUMERIC_DISCRETE):
+            s, vals, quantiles = self._numeric_values(df, col, numeric_cache)
+            if len(s) > 0:
+                q1, q3 = quantiles[_Q1_POS], quantiles[_Q3_POS]
+                iqr = q3 - q1
+                outlier_iqr = int(((vals < q1 - 1.5 * iqr) | (vals > q3 + 1.5 * iqr)).sum()) if iqr > 0 else 0
+                mean, std = s.mean(), s.std()
+                outlier_z = int((np.abs((vals - mean) / std) > 3).sum()) if std > 0 else 0
+
+                return "numeric_columns", {
+                    "mean": round(float(mean), 4),
+                    "median": round(float(np.median(vals)), 4),
+                    "std": round(float(std), 4),
+                    "min": round(float(vals.min()), 4),
+                    "max": round(float(vals.max()), 4),
+                    "skewness": round(float(s.skew()), 4),
+                    "kurtosis": round(float(s.kurtosis()), 4),
+                    "outlier_count_iqr": outlier_iqr,
+                    "outlier_count_zscore": outlier_z,
+                }
+
+        elif sem_type in (SemanticType.CATEGORICAL, SemanticType.BOOLEAN):
             non_null = df[col].dropna()
             if len(non_null) > 0:
-                vc = non_null.value_counts().head(10)
-                profile["top_values"] = [
-                    (str(val), int(cnt)) for val, cnt in vc.items()
-                ]
-
-            if profile:
-                profiling[col] = profile
+                vc = non_null.value_counts()
+                rare = vc[vc / len(non_null) < 0.005]
+                return "categorical_columns", {
+                    "n_unique": int(non_null.nunique()),
+                    "top_value": str(vc.index[0]),
+                    "top_freq": round(float(vc.iloc[0] / len(non_null)), 4),
+                    "rare_categories": [str(c) for c in rare.index[:10]],
+                }
+
+        elif sem_type in (SemanticType.DATE, SemanticType.DATETIME):
+            dt = pd.to_datetime(df[col], errors="coerce").dropna()
+            if len(dt) > 0:
+                diffs = dt.sort_values().diff().dropna()
+                gap_count = 0
+                if len(diffs) > 0:
+                    median_diff = diffs.median()
+                    if median_diff > pd.Timedelta(0):
+                        gap_count = int((diffs > 3 * median_diff).sum())
+
+                return "date_columns", {
+                    "min_date": str(dt.min()),
+                    "max_date": str(dt.max()),
+                    "formats_found": [],  # Populated by DATE_FORMAT_MIX check
+                    "gap_count": gap_count,
+                }
+
+        return None
+
+    def _build_column_profiling(self, df: pd.DataFrame, column_types: Dict[str, SemanticType],
+                                numeric_cache: Optional[Dict[str, Tuple]] = None) -> Dict:
+        """Profiling detallado por columna: percentiles, histograma textual, top valores, CV."""
+        return {
+            col: profile
+            for col, profile in self._map_columns(self._column_profile, df, column_types, numeric_cache)
+            if profile
+        }
 
-        return profiling
+    def _column_profile(self, col: str, sem_type: SemanticType, df: pd.DataFrame,
+                        numeric_cache: Optional[Dict[str, Tuple]]) -> Dict:
+        """Profiling de una columna (vacío si no hay nada que reportar)."""
+        profile = {}
+
+        if sem_type in (SemanticType.NUMERIC_CONTINUOUS, SemanticType.NUMERIC_DISCRETE):
+            s, vals, quantiles = self._numeric_values(df, col, numeric_cache)
+            if len(s) > 0:
+                profile["percentiles"] = {
+                    f"p{int(k*100)}": round(float(v), 4) for k, v in zip(PROFILE_QUANTILES, quantiles)
+                }
+                q1, q3 = quantiles[_Q1_POS], quantiles[_Q3_POS]
+                profile["iqr"] = round(float(q3 - q1), 4)
+                mean = s.mean()
+                std = s.std()
+                profile["cv"] = round(float(std / mean), 4) if mean != 0 else None
+
+                # Histograma textual (10 bins)
+                try:
+                    counts, edges = np.histogram(vals, bins=10)
+                    max_count = int(counts.max())
+                    # Largos de barra en una operación entera; tolist() evita escalares numpy por bin
+                    bar_lens = (20 * counts // max_count).tolist() if max_count > 0 else [0] * len(counts)
+                    profile["histogram"] = [
+                        {"range": f"{lo:.2f}-{hi:.2f}", "count": c, "bar": "█" * bar_len}
+                        for lo, hi, c, bar_len in zip(edges[:-1].tolist(), edges[1:].tolist(),
+                                                      counts.tolist(), bar_lens)
+                    ]
+                except Exception as e:
+                    logger.debug("No se pudo generar histograma para '%s': %s", col, e)
+
+        # Top valores (para cualquier tipo)
+        non_null = df[col].dropna()
+        if len(non_null) > 0:
+            vc = non_null.value_counts().head(10)
+            profile["top_values"] = [
+                (str(val), int(cnt)) for val, cnt in vc.items()
+            ]
+
+        return profile
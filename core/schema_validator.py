@@ -23,6 +23,7 @@ from typing import Dict, List
 import pandas as pd
 import numpy as np
 
+from utils.unique_values import apply_via_categories
 from models.check_result import CheckResult
 from models.semantic_type import SemanticType
 
@@ -185,7 +186,9 @@ class SchemaValidator:
             regex = re.compile(pattern)
             raw = df_raw[col_name].astype(str).str.strip()
             non_empty = raw[(raw != "") & (raw != "nan")]
-            no_match = non_empty[~non_empty.apply(lambda x: bool(regex.match(x)))]
+            # str.match (anclado al inicio, como regex.match) una vez por valor único
+            matches = apply_via_categories(non_empty, lambda v: v.str.match(regex))
+            no_match = non_empty[~matches.to_numpy(dtype=bool)]
             v_count = len(no_match)
             if v_count > 0:
                 results.append(CheckResult(
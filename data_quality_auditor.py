@@ -5,7 +5,6 @@ import logging
 import os
 import sys
 import glob
-import json
 import argparse
 from datetime import datetime
 
@@ -127,6 +126,10 @@ def main():
     parser.add_argument("--schema", help="Ruta a archivo YAML de schema esperado")
     parser.add_argument("--config", help="Ruta a archivo YAML de configuración (umbrales, toggles)")
     parser.add_argument("--batch", help="Ruta a directorio para procesar todos los CSVs")
+    parser.add_argument("--output-archive",
+                        help="En modo batch, guardar todos los reportes en un único archivo .zip")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Procesos paralelos en modo batch (default: número de CPUs)")
     parser.add_argument("--compare", help="Ruta a CSV de referencia para detección de drift")
     parser.add_argument("--no-auto-output", action="store_true",
                         help="No generar outputs automáticos en outputs/")
@@ -170,8 +173,7 @@ def main():
         else:
             out = args.output or "drift_report.json"
 
-        with open(out, "w", encoding="utf-8") as f:
-            json.dump(drift_report, f, ensure_ascii=False, indent=2, default=str)
+        detector.to_json(drift_report, out)
         if not args.quiet:
             logger.info("Drift report guardado en: %s", out)
             detector.print_summary(drift_report)
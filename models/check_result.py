@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     check_id: str
     column: str
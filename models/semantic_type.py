@@ -15,3 +15,10 @@ class SemanticType(Enum):
     MIXED = "MIXED"
     EMPTY = "EMPTY"
     CONSTANT = "CONSTANT"
+
+
+# Posición de cada tipo en orden de declaración: permite tablas indexadas por tupla
+# (Enum.__hash__ se ejecuta en Python y hace lentos los dicts con SemanticType como clave)
+for _index, _member in enumerate(SemanticType):
+    _member.index = _index
+del _index, _member
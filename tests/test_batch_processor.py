@@ -0,0 +1,109 @@
+"""Tests para core/batch_processor.py"""
+
+import json
+import os
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.batch_processor import BatchProcessor, ReportSink, _list_csv_files
+
+
+def _write_dataset(directory):
+    rng = np.random.default_rng(0)
+    for name in ("ventas", "clientes"):
+        pd.DataFrame({
+            "id": range(1, 61),
+            "monto": rng.normal(100, 10, 60).round(2),
+            "region": rng.choice(["norte", "sur"], 60),
+        }).to_csv(directory / f"{name}.csv", index=False)
+    (directory / "roto.csv").write_bytes(b"\x00\x01\x02" * 100)
+    (directory / ".oculto.csv").write_text("a\n1\n")
+    (directory / "notas.txt").write_text("no es csv")
+
+
+def _args(**kwargs):
+    defaults = {"jobs": 1, "quiet": True, "date_col": None, "output": None, "output_archive": None}
+    defaults.update(kwargs)
+    return SimpleNamespace(**defaults)
+
+
+def test_list_csv_files_skips_hidden_and_other_extensions(tmp_path):
+    _write_dataset(tmp_path)
+    names = [os.path.basename(p) for p in _list_csv_files(str(tmp_path))]
+    assert names == ["clientes.csv", "roto.csv", "ventas.csv"]
+    assert _list_csv_files(str(tmp_path / "no_existe")) == []
+
+
+def test_report_sink_requires_write():
+    with pytest.raises(TypeError):
+        ReportSink()
+
+
+def test_batch_output_archive_members(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    _write_dataset(data_dir)
+    archive = tmp_path / "reportes.zip"
+    BatchProcessor(_args(output_archive=str(archive))).run(str(data_dir))
+
+    with zipfile.ZipFile(archive) as zf:
+        assert sorted(zf.namelist()) == [
+            "batch_summary.json", "batch_summary.md",
+            "clientes_report.json", "clientes_report.md",
+            "ventas_report.json", "ventas_report.md",
+        ]
+        summary = json.loads(zf.read("batch_summary.json"))
+        report = json.loads(zf.read("ventas_report.json"))
+    assert (summary["total_files"], summary["successful"], summary["errors"]) == (3, 2, 1)
+    by_file = {f["file"]: f for f in summary["files"]}
+    assert by_file["roto.csv"]["grade"] == "ERROR"
+    assert by_file["ventas.csv"]["rows"] == 60
+    assert by_file["ventas.csv"]["score"] == report["dataset_summary"]["health_score"]
+    assert not (data_dir / "reports").exists()
+
+
+def test_batch_process_pool_matches_serial(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    _write_dataset(data_dir)
+    summaries = []
+    for jobs in (1, 2):
+        out = tmp_path / f"reports_{jobs}"
+        BatchProcessor(_args(jobs=jobs, output=str(out))).run(str(data_dir))
+        assert sorted(p.name for p in out.iterdir()) == [
+            "batch_summary.json", "batch_summary.md",
+            "clientes_report.json", "clientes_report.md",
+            "ventas_report.json", "ventas_report.md",
+        ]
+        summary = json.loads((out / "batch_summary.json").read_text(encoding="utf-8"))
+        summary.pop("generated_at")
+        summaries.append(summary)
+    assert summaries[0] == summaries[1]
+
+
+def test_iter_unordered_bounds_in_flight_files():
+    lock = threading.Lock()
+    active = [0, 0]  # [en vuelo, máximo observado]
+
+    def worker(name):
+        with lock:
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        time.sleep(0.2 if name == "lento" else 0.01)
+        with lock:
+            active[0] -= 1
+        return name
+
+    files = ["lento", "a", "b", "c", "d"]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        out = list(BatchProcessor._iter_unordered(executor, worker, files, max_pending=2))
+    assert sorted(out) == sorted(enumerate(files))
+    assert out[0] != (0, "lento")
+    assert active[1] <= 2
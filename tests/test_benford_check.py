@@ -40,3 +40,11 @@ def test_benford_all_zeros():
     s = pd.Series([0] * 200, name="col")
     result = check_benford_law(s.astype(str), s, _meta())
     assert result.passed  # Zeros excluded, insufficient data
+
+
+def test_first_digits_matches_string_formatting():
+    from checks.benford_check import _first_digits
+    rng = np.random.default_rng(1)
+    x = np.concatenate([10 ** rng.uniform(-10, 12, 5000), [1e-5, 3e-5, 1000.0, 999.99999999999]])
+    expected = [int(f"{v:.10e}"[0]) for v in x]
+    assert _first_digits(x).tolist() == expected
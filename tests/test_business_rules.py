@@ -1,5 +1,6 @@
 """Tests para Business Rules Engine."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -61,3 +62,122 @@ def test_empty_dataframe():
     results = engine.evaluate(df)
     assert len(results) == 1
     assert results[0].passed
+
+
+def test_rules_reused_across_dataframes():
+    rules = [{"name": "Age range", "assertion": "0 <= age <= 120", "severity": "HIGH"}]
+    engine = BusinessRulesEngine(rules)
+    first = engine.evaluate(pd.DataFrame({"age": [10, 130, -1]}))
+    second = engine.evaluate(pd.DataFrame({"age": [10, 20]}))
+    assert first[0].affected_count == 2
+    assert second[0].passed
+
+
+def test_in_operator_uses_isin_not_index():
+    # "in" de Python buscaría en el índice de la Series: debe evaluarse elementwise (isin)
+    df = pd.DataFrame({"code": [1, 5, 2, 9], "allowed": [2, 1, 7, 0]})
+    engine = BusinessRulesEngine([
+        {"name": "In", "assertion": "code in allowed", "severity": "HIGH"},
+        {"name": "Not in", "assertion": "code not in allowed", "severity": "HIGH"},
+    ])
+    results = engine.evaluate(df)
+    assert [r.affected_count for r in results] == [2, 2]
+
+
+def test_not_null_condition_combined():
+    rules = [{
+        "name": "Age consistency",
+        "condition": "age is not null and status == 'active'",
+        "assertion": "age >= 0",
+        "severity": "MEDIUM",
+    }]
+    df = pd.DataFrame({"age": [5, None, -3, -4], "status": ["active", "active", "active", "off"]})
+    results = BusinessRulesEngine(rules).evaluate(df)
+    assert results[0].metadata["applicable_rows"] == 2
+    assert results[0].affected_count == 1
+
+
+def test_nullable_masks_treat_na_as_not_applicable():
+    df = pd.DataFrame({
+        "b": pd.array([3, 1, None, 4, 5, 0], dtype="Int64"),
+        "flag": pd.array([True, True, None, True, True, False], dtype="boolean"),
+    })
+    plain, conditional = BusinessRulesEngine([
+        {"name": "b", "assertion": "b > 2", "severity": "HIGH"},
+        {"name": "c", "condition": "flag", "assertion": "b > 2", "severity": "HIGH"},
+    ]).evaluate(df)
+    assert not plain.metadata.get("error")
+    assert plain.affected_count == 2
+    assert plain.metadata["violation_indices"] == [1, 5]
+    assert conditional.metadata["applicable_rows"] == 4
+    assert conditional.affected_count == 1
+
+
+def test_null_check_assertions_are_evaluated():
+    df = pd.DataFrame({"s": ["a", None, "c", None, "e"], "n": [1.0, 2.0, np.nan, 4.0, 5.0]})
+    results = BusinessRulesEngine([
+        {"name": "Not null", "assertion": "s is not null", "severity": "HIGH"},
+        {"name": "Null", "assertion": "n is null", "severity": "HIGH"},
+        {"name": "Mixed", "assertion": "n is not null and n > 1", "severity": "HIGH"},
+    ]).evaluate(df)
+    assert [r.affected_count for r in results] == [2, 4, 2]
+    assert results[0].metadata["violation_indices"] == [1, 3]
+
+
+def test_violation_indices_use_index_labels():
+    rules = [{
+        "name": "Refund needs cancellation",
+        "condition": "status == 'cancelled'",
+        "assertion": "refund > 0",
+        "severity": "HIGH",
+    }]
+    df = pd.DataFrame(
+        {"status": ["cancelled", "active", "cancelled", "cancelled"], "refund": [0, 0, 5, 0]},
+        index=[10, 11, 12, 13],
+    )
+    result = BusinessRulesEngine(rules).evaluate(df)[0]
+    assert result.metadata["applicable_rows"] == 3
+    assert result.metadata["violation_indices"] == [10, 13]
+
+
+def test_validate_expression_token_allowlist():
+    from core.business_rules import _validate_expression
+    _validate_expression("executive_count >= 0 and region == 'norte'")
+    for bad in ["a = 5", "df.x > 0", "f'{x}' == 'a'", "__class__ > 0", "(a > 0"]:
+        with pytest.raises(ValueError):
+            _validate_expression(bad)
+
+
+def test_eval_assertion_and_split_case_insensitive():
+    df = pd.DataFrame({"a": [1, 5, 20, 3], "b": [2, 2, 2, 9]})
+    mask = BusinessRulesEngine([])._eval_assertion("a > 0 AND a < 10 and b < 5", df)
+    assert mask.tolist() == [True, True, False, False]
+    assert mask.index.equals(df.index)
+
+
+def test_isnull_float_fast_path_matches_isna():
+    from core.business_rules import _isnull
+    for s in (pd.Series([1.0, np.nan, 3.0]), pd.Series(["a", None, "c"]),
+              pd.Series([1, None, 3], dtype="Int64")):
+        assert _isnull(s).tolist() == s.isna().tolist()
+
+
+def test_unevaluable_fallbacks_mean_all_rows():
+    engine = BusinessRulesEngine([])
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    assert engine._eval_condition("otra is not null", df) is None
+    assert engine._eval_assertion("a > 0 or a < 0", df) is None
+    rule = {"name": "r", "condition": "otra is not null", "assertion": "a > 1"}
+    result = engine._evaluate_rule(rule, df)
+    assert result.metadata["applicable_rows"] == 3
+    assert result.affected_count == 1
+
+
+def test_rules_preserve_order_and_isolate_errors():
+    rules = [{"name": f"r{i}", "assertion": f"a > {i}"} for i in range(8)]
+    rules.append({"name": "rota", "assertion": "__import__('os')"})
+    df = pd.DataFrame({"a": range(10)})
+    results = BusinessRulesEngine(rules).evaluate(df)
+    assert [r.metadata["rule_name"] for r in results] == [f"r{i}" for i in range(8)] + ["rota"]
+    assert [r.affected_count for r in results[:8]] == [i + 1 for i in range(8)]
+    assert results[-1].metadata.get("error")
@@ -0,0 +1,73 @@
+"""Tests para core/drift_detector.py"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core import json_output
+from core.drift_detector import DriftDetector
+
+
+def _tests_by_column(drifts):
+    return {d["column"]: {t["test"]: t for t in d["tests"]} for d in drifts}
+
+
+def test_column_drifts_null_rate_and_cardinality():
+    ref = pd.DataFrame({"a": [1.0, 2.0, 3.0, 4.0] * 25, "b": ["x", "y"] * 50})
+    cur = pd.DataFrame({"a": [1.0, np.nan, np.nan, 4.0] * 25, "b": ["x", "y", "z", "w"] * 25})
+    tests = _tests_by_column(DriftDetector()._column_drifts(ref, cur))
+
+    assert tests["a"]["null_rate_change"]["current"] == 0.5
+    assert tests["b"]["cardinality_change"]["reference"] == 2
+    assert tests["b"]["cardinality_change"]["current"] == 4
+
+
+def test_column_drifts_numeric_shift_detected():
+    rng = np.random.default_rng(0)
+    ref = pd.DataFrame({"v": rng.normal(0, 1, 500)})
+    cur = pd.DataFrame({"v": rng.normal(2, 1, 500)})
+    drifts = DriftDetector()._column_drifts(ref, cur)
+    assert drifts[0]["has_drift"]
+    assert _tests_by_column(drifts)["v"]["ks_2sample"]["significant"]
+
+
+def test_column_drifts_string_columns_use_categorical_tests():
+    """Columnas de texto (object o str de pandas >= 3) pasan por chi-cuadrado y categorías."""
+    ref = pd.DataFrame({"shift": ["a", "b", "c"] * 40, "new": ["a", "b", "c"] * 40})
+    cur = pd.DataFrame({"shift": ["a"] * 100 + ["b", "c"] * 10, "new": ["a", "b", "c", "d", "e", "f", "g"] * 17 + ["a"]})
+    for frame in (ref, cur):
+        frame["shift_obj"] = frame["shift"].astype(object)
+        frame["new_obj"] = frame["new"].astype(object)
+    tests = _tests_by_column(DriftDetector()._column_drifts(ref, cur))
+    for suffix in ("", "_obj"):
+        assert tests["shift" + suffix]["chi2_distribution"]["significant"]
+        assert tests["new" + suffix]["category_changes"]["new_categories"] == ["d", "e", "f", "g"]
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_to_json_writes_booleans_and_numpy_values(tmp_path, monkeypatch, has_orjson):
+    if has_orjson and not json_output.HAS_ORJSON:
+        pytest.skip("orjson no instalado")
+    monkeypatch.setattr(json_output, "HAS_ORJSON", has_orjson)
+    ref = pd.DataFrame({"a": np.arange(100, dtype=float)})
+    cur = pd.DataFrame({"a": np.arange(100, dtype=float) + 50})
+    report = {"column_drifts": DriftDetector()._column_drifts(ref, cur), "n": np.int64(3)}
+    out = tmp_path / "drift_report.json"
+    DriftDetector().to_json(report, str(out))
+
+    loaded = json.loads(out.read_text(encoding="utf-8"))
+    ks = {t["test"]: t for t in loaded["column_drifts"][0]["tests"]}["ks_2sample"]
+    assert ks["significant"] is True
+    assert loaded["n"] == 3
+
+
+def test_schema_diff_added_removed_and_type_changes():
+    ref = pd.DataFrame({"a": [1, 2], "b": [1.0, 2.0], "gone": ["x", "y"]})
+    cur = pd.DataFrame({"a": ["1", "2"], "b": [3.0, 4.0], "new": [0, 1]})
+    diff = DriftDetector()._schema_diff(ref, cur)
+    assert diff["added"] == ["new"]
+    assert diff["removed"] == ["gone"]
+    assert diff["common"] == ["a", "b"]
+    assert [(t["column"], t["reference_dtype"]) for t in diff["type_changed"]] == [("a", "int64")]
@@ -73,3 +73,45 @@ def test_export_csv(tmp_path):
     loaded = pd.read_csv(path)
     assert len(loaded) > 0
     assert "row_number" in loaded.columns
+
+
+def test_whitespace_flagging():
+    values = ["ok", " pad", "x ", "   ", "", "ok"] * 20
+    df_raw = pd.DataFrame({"a": values})
+    results = [
+        CheckResult(
+            check_id="WHITESPACE_ISSUES", column="a", passed=False, severity="LOW",
+            value=0.5, threshold=0.01, message="whitespace",
+        )
+    ]
+    exporter = FlaggedRowsExporter()
+    flagged = exporter.collect_flagged_rows(df_raw, df_raw, results, {"a": None})
+    assert list(flagged["row_number"][:4]) == [2, 3, 8, 9]
+    assert set(flagged["value"]) == {" pad", "x "}
+
+
+def test_export_roundtrip(tmp_path):
+    flagged = pd.DataFrame({
+        "row_number": [3, 1], "column": ["a", "b"], "check_id": ["NULL_RATE"] * 2,
+        "severity": ["HIGH", "LOW"], "value": ['con "comillas", y coma', ""],
+        "detail": ["x", "y"],
+    })
+    path = str(tmp_path / "flagged.csv")
+    FlaggedRowsExporter().export(flagged, path)
+
+    loaded = pd.read_csv(path, keep_default_na=False, dtype={"value": str})
+    assert loaded["row_number"].tolist() == [3, 1]
+    assert loaded["value"].tolist() == ['con "comillas", y coma', ""]
+
+
+def test_date_flagging_before_ns_range():
+    # Fechas anteriores a 1677 no caben en datetime64[ns]: deben marcarse igual
+    values = ["2020-01-01", "1000-06-15", "basura", "2999-01-01", "1899-12-31"]
+    df = pd.DataFrame({"d": values})
+    exporter = FlaggedRowsExporter()
+    for check_id, expected in (("DATE_ANCIENT", [1, 4]), ("DATE_FUTURE", [3])):
+        result = CheckResult(
+            check_id=check_id, column="d", passed=False, severity="MEDIUM",
+            value=0.2, threshold=0.0, message="dates",
+        )
+        assert exporter._get_flagged_indices(result, df, df, "d") == expected
@@ -173,6 +173,24 @@ def test_referential_integrity_clean():
     assert results[0].passed
 
 
+def test_referential_integrity_matches_set_semantics():
+    from core.referential_integrity import ReferentialIntegrityChecker
+
+    orders = pd.DataFrame({"customer_id": ["c3", "c1", "c9", None, "c7", "c9"], "amount": [10, 20, 30, 10, 20, 40]})
+    customers = pd.DataFrame({"id": ["c1", "c2", "c3"], "code": [10.0, 20.0, None]})
+
+    rules = [{"child_table": "orders.csv", "child_column": "customer_id",
+              "parent_table": "customers.csv", "parent_column": "id"},
+             {"child_table": "orders.csv", "child_column": "amount",
+              "parent_table": "customers.csv", "parent_column": "code"}]
+
+    checker = ReferentialIntegrityChecker(rules)
+    by_col, by_num = checker.validate({"orders.csv": orders, "customers.csv": customers})
+    assert by_col.sample_values == ["c9", "c7"]  # orden de aparición, nulos ignorados
+    assert by_col.affected_count == 2
+    assert by_num.sample_values == ["30", "40"]  # 10 y 20 (int) existen como 10.0 y 20.0
+
+
 def test_trend_analyzer(tmp_path):
     from core.trend_analyzer import TrendAnalyzer
 
@@ -311,3 +329,40 @@ def test_config_validation_missing_fk_fields():
     config = {"foreign_keys": [{"child_table": "a.csv"}]}
     with pytest.raises(ConfigValidationError, match="faltan campos"):
         _validate_config(config)
+
+
+def test_config_load_yaml(tmp_path):
+    """ConfigLoader.load parsea el YAML (loader C si existe) igual que yaml.safe_load."""
+    import yaml
+    from core.config_loader import ConfigLoader
+    text = "disabled_checks:\n  - BENFORD_LAW\nseverity_overrides:\n  MEAN_SHIFT: LOW\nscoring:\n  HIGH: 10\n"
+    path = tmp_path / "config.yaml"
+    path.write_text(text, encoding="utf-8")
+    config = ConfigLoader.load(str(path))
+    parsed = yaml.safe_load(text)
+    assert config["disabled_checks"] == set(parsed["disabled_checks"])
+    assert config["severity_overrides"] == parsed["severity_overrides"]
+    assert config["scoring"] == parsed["scoring"]
+
+
+def test_config_load_cached_until_file_changes(tmp_path):
+    """Un config sin cambios se sirve desde cache; al modificarse se vuelve a parsear."""
+    from core.config_loader import ConfigLoader
+    path = tmp_path / "config.yaml"
+    path.write_text("disabled_checks:\n  - BENFORD_LAW\n", encoding="utf-8")
+    first = ConfigLoader.load(str(path))
+    second = ConfigLoader.load(str(path))
+    assert first is not second
+    assert first["disabled_checks"] is second["disabled_checks"]
+
+    path.write_text("disabled_checks:\n  - BENFORD_LAW\n  - NULL_RATE\n", encoding="utf-8")
+    assert ConfigLoader.load(str(path))["disabled_checks"] == {"BENFORD_LAW", "NULL_RATE"}
+
+
+def test_config_load_leaves_no_files_next_to_yaml(tmp_path):
+    """La carga solo lee el YAML: no deja caches junto al config del usuario."""
+    from core.config_loader import ConfigLoader
+    path = tmp_path / "config.yaml"
+    path.write_text("severity_overrides:\n  NULL_RATE: HIGH\n", encoding="utf-8")
+    assert ConfigLoader.load(str(path))["severity_overrides"] == {"NULL_RATE": "HIGH"}
+    assert [p.name for p in tmp_path.iterdir()] == ["config.yaml"]
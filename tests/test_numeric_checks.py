@@ -6,7 +6,7 @@ from checks.numeric_checks import (
     check_outlier_iqr, check_outlier_zscore, check_outlier_modified_z,
     check_distribution_skew, check_distribution_kurtosis,
     check_negative_values, check_zero_values, check_value_range,
-    check_normality_test,
+    check_normality_test, check_negative_values_batch, check_zero_values_batch,
 )
 
 
@@ -104,3 +104,29 @@ def test_insufficient_data():
     s = pd.Series([1, 2, 3], name="col")
     result = check_outlier_iqr(s.astype(str), s, _meta())
     assert result.passed  # Too few data points
+
+
+def test_batch_checks_match_per_column():
+    df = pd.DataFrame({
+        "a": [-1.0, 0.0, 2.0, np.nan, -5.0],
+        "b": [0, 0, 1, 2, 3],
+        "c": ["1", "-2", "x", "0", "3"],
+    })
+    for batch, single in ((check_negative_values_batch, check_negative_values),
+                          (check_zero_values_batch, check_zero_values)):
+        results = batch(df.astype(str), df, {})
+        for col in df.columns:
+            assert results[col].to_dict() == single(df[col], df[col], {}).to_dict()
+
+
+def test_numeric_block_summary_chunked(monkeypatch):
+    import checks.numeric_checks as nc
+    monkeypatch.setattr(nc, "SUMMARY_CHUNK", 3)
+    df = pd.DataFrame({"a": [-1.0, 0.0, np.nan, 0.0, 2.0, -3.0, np.nan], "b": [0, 1, -2, 0, 0, 5, 6]})
+    meta = {}
+    summary = nc.numeric_block_summary(df, meta)
+    assert summary == {"a": (2, 2, 2), "b": (0, 3, 1)}
+    assert nc.numeric_block_summary(df, meta) is summary
+    # El mismo metadata con otro bloque (mismas columnas) no devuelve los conteos anteriores
+    other = df.fillna(1.0).abs()
+    assert nc.numeric_block_summary(other, meta) == {"a": (0, 2, 0), "b": (0, 3, 0)}
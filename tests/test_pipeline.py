@@ -5,6 +5,7 @@ import json
 import tempfile
 import pandas as pd
 import numpy as np
+import pytest
 
 from core.data_loader import DataLoader
 from core.type_detector import TypeDetector
@@ -83,6 +84,36 @@ def test_full_pipeline_categorical():
     os.unlink(path)
 
 
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_report_to_json_with_and_without_orjson(tmp_path, monkeypatch, has_orjson):
+    from core import json_output
+
+    if has_orjson and not json_output.HAS_ORJSON:
+        pytest.skip("orjson no instalado")
+    monkeypatch.setattr(json_output, "HAS_ORJSON", has_orjson)
+    report = {"archivo": "año.csv", "score": np.float64(87.5), "ok": np.bool_(True),
+              "conteos": {1: 2}, "generado": pd.Timestamp("2024-01-01"),
+              "media": float("nan"), "valores": np.array([1.0, np.nan])}
+    out = tmp_path / "report.json"
+    ReportBuilder().to_json(report, str(out))
+
+    loaded = json.loads(out.read_text(encoding="utf-8"))
+    assert loaded == {"archivo": "año.csv", "score": 87.5, "ok": True, "conteos": {"1": 2},
+                      "generado": "2024-01-01T00:00:00", "media": None, "valores": [1.0, None]}
+
+
+def test_json_output_same_bytes_with_and_without_orjson(monkeypatch):
+    from core import json_output
+
+    if not json_output.HAS_ORJSON:
+        pytest.skip("orjson no instalado")
+    report = {"n": np.int64(3), "ok": np.bool_(False), "pct": np.float64(12.5), "nan": np.nan,
+              "cuando": pd.Timestamp("2024-03-01 10:30:00"), "tipos": ["ID", "EMAIL"]}
+    with_orjson = json_output.dumps(report)
+    monkeypatch.setattr(json_output, "HAS_ORJSON", False)
+    assert json_output.dumps(report) == with_orjson
+
+
 def test_markdown_generation():
     """Test que generate_markdown produce output válido."""
     report = {
@@ -159,3 +190,202 @@ def test_binary_file_detection():
         assert "binario" in str(e).lower()
     finally:
         os.unlink(path)
+
+
+def test_check_engine_reused_across_datasets():
+    """Un CheckEngine reutilizado (worker de batch) evalúa duplicados en cada dataset."""
+    df = pd.DataFrame({"a": [1, 1, 2, 3] * 5, "b": ["x", "x", "y", "z"] * 5})
+    df_raw = df.astype(str)
+    types = TypeDetector().detect(df_raw, df)
+
+    engine = CheckEngine()
+    for _ in range(2):
+        results = engine.run_all(df_raw, df, types)
+        assert any(r.check_id == "DUPLICATE_ROWS" for r in results)
+
+
+def test_check_engine_applies_config():
+    """disabled_checks y severity_overrides se respetan en cada columna."""
+    df = pd.DataFrame({"a": [1.0, None, None, 4.0] * 5, "b": [None, 2.0, 3.0, None] * 5})
+    df_raw = df.astype(str)
+    types = TypeDetector().detect(df_raw, df)
+
+    config = {"disabled_checks": {"DUPLICATE_ROWS"}, "severity_overrides": {"NULL_RATE": "LOW"}}
+    results = CheckEngine(config=config).run_all(df_raw, df, types)
+    assert not any(r.check_id == "DUPLICATE_ROWS" for r in results)
+    null_rate = [r for r in results if r.check_id == "NULL_RATE" and not r.passed]
+    assert null_rate and all(r.severity == "LOW" for r in null_rate)
+
+
+def test_check_engine_parallel_matches_serial():
+    """La ejecución con hilos produce los mismos resultados y en el mismo orden."""
+    np.random.seed(0)
+    df = pd.DataFrame({
+        "a": np.random.normal(0, 1, 200),
+        "b": np.random.choice(["x", "y", "z"], 200),
+        "c": np.where(np.random.rand(200) < 0.1, np.nan, np.random.rand(200)),
+    })
+    df_raw = df.astype(str)
+    types = TypeDetector().detect(df_raw, df)
+
+    def summary(results):
+        return [(r.check_id, r.column, r.passed, r.severity, r.message) for r in results]
+
+    serial = CheckEngine().run_all(df_raw, df, types)
+    parallel = CheckEngine(max_workers=4).run_all(df_raw, df, types)
+    assert CheckEngine().max_workers == 1
+    assert summary(serial) == summary(parallel)
+
+
+def test_check_engine_missing_column():
+    """Una columna de column_types ausente en el DataFrame no rompe la ejecución."""
+    from models.semantic_type import SemanticType
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+    types = {"a": SemanticType.NUMERIC_CONTINUOUS, "fantasma": SemanticType.CATEGORICAL}
+    results = CheckEngine(max_workers=1).run_all(df.astype(str), df, types)
+    assert any(r.column == "fantasma" for r in results)
+
+
+def test_check_engine_dataset_analysis_disabled():
+    """Los análisis a nivel dataset también se pueden deshabilitar por config."""
+    np.random.seed(1)
+    df = pd.DataFrame({"a": np.random.normal(size=100), "b": np.random.normal(size=100)})
+    df["c"] = df["a"] * 2
+    df_raw = df.astype(str)
+    types = TypeDetector().detect(df_raw, df)
+
+    def ids(config):
+        return {r.check_id for r in CheckEngine(config=config, max_workers=1).run_all(df_raw, df, types)}
+
+    assert "HIGH_CORRELATION" in ids(None)
+    assert "HIGH_CORRELATION" not in ids({"disabled_checks": {"CROSS_COLUMN"}})
+
+
+def test_check_engine_parses_only_the_selected_date_column():
+    from models.semantic_type import SemanticType
+
+    df = pd.DataFrame({"alta": ["2024-01-01", "2024-01-02"], "baja": ["2024-02-01", "x"], "v": [1, 2]})
+    types = {"alta": SemanticType.DATE, "baja": SemanticType.DATETIME, "v": SemanticType.NUMERIC_DISCRETE}
+    assert list(CheckEngine._build_datetime_cache(df, types)) == ["alta"]
+    cache = CheckEngine._build_datetime_cache(df, types, date_col="baja")
+    assert list(cache) == ["baja"] and cache["baja"].isna().tolist() == [False, True]
+    assert list(CheckEngine._build_datetime_cache(df, types, date_col="no_existe")) == ["alta"]
+    assert CheckEngine._build_datetime_cache(df, {"v": SemanticType.NUMERIC_DISCRETE}) == {}
+
+
+def test_check_engine_run_all_iter_streams_same_results():
+    """run_all_iter entrega los mismos resultados que run_all, de forma perezosa."""
+    df = pd.DataFrame({"a": [1.0, None, 3.0, -4.0] * 5, "b": ["x", "y", "x", "z"] * 5})
+    df_raw = df.astype(str)
+    types = TypeDetector().detect(df_raw, df)
+
+    engine = CheckEngine(max_workers=1)
+    stream = engine.run_all_iter(df_raw, df, types)
+    assert not isinstance(stream, list)
+    streamed = [(r.check_id, r.column, r.passed, r.message) for r in stream]
+    listed = [(r.check_id, r.column, r.passed, r.message) for r in engine.run_all(df_raw, df, types)]
+    assert streamed == listed
+
+
+def test_check_engine_run_all_iter_bounds_submitted_checks(monkeypatch):
+    """Con hilos, el primer resultado llega sin haber encolado todos los checks por columna."""
+    import core.check_engine as ce
+
+    submitted = []
+
+    class CountingPool(ce.ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(fn)
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(ce, "ThreadPoolExecutor", CountingPool)
+    monkeypatch.setattr(ce, "SUBMIT_AHEAD_PER_WORKER", 1)
+    df = pd.DataFrame({f"c{i}": [f"v{j % 7}" for j in range(30)] for i in range(6)})
+    df_raw = df.astype(str)
+    types = TypeDetector().detect(df_raw, df)
+
+    engine = CheckEngine(max_workers=2)
+    stream = engine.run_all_iter(df_raw, df, types)
+    next(stream)
+    column_tasks = sum(fn == engine._safe_execute for fn in submitted)
+    assert 0 < column_tasks <= 2
+    rest = list(stream)
+    assert len(rest) + 1 == len(CheckEngine(max_workers=1).run_all(df_raw, df, types))
+    assert sum(fn == engine._safe_execute for fn in submitted) > 2
+
+
+def test_check_registry_index_table_matches_map():
+    """La tabla indexada por SemanticType.index equivale a TYPE_CHECK_MAP."""
+    from models.semantic_type import SemanticType
+    from core.check_registry import CheckRegistry, TYPE_CHECK_MAP
+
+    registry = CheckRegistry()
+    for member in SemanticType:
+        assert registry.get_checks_for_type(member) is TYPE_CHECK_MAP[member]
+
+
+def test_check_dates_weights_repeated_values():
+    """Valores repetidos cuentan por su frecuencia; por debajo del umbral no es fecha."""
+    detector = TypeDetector()
+    dates = pd.Series(["2024-01-05"] * 9 + ["2024-01-06 10:30:00"] * 9 + ["nope"] * 2)
+    assert detector._check_dates(dates) == (True, 0.9)
+    mostly_text = pd.Series(["nope"] * 5 + ["2024-01-05"] * 15)
+    is_datetime, match_pct = detector._check_dates(mostly_text)
+    assert match_pct <= 0.80
+    df = pd.DataFrame({"d": ["2024-01-05", "05/01/2024", "x"] * 10 + ["2024-02-01"] * 30})
+    assert detector.detect(df, df)["d"].value == "DATE"
+
+
+def test_detect_delimiter_from_bytes():
+    """El delimiter se detecta sobre los bytes, con cualquier fin de línea."""
+    loader = DataLoader()
+    assert loader._detect_delimiter("", "utf-8", b"a;b;c\r\n1;2;3\r\n4;5;6\r\n") == ";"
+    assert loader._detect_delimiter("", "utf-8", b"a|b\r1|2\r3|4\r") == "|"
+    assert loader._detect_delimiter("", "latin-1", "ñ\tx\né\t1\n".encode("latin-1")) == "\t"
+    assert loader._detect_delimiter("", "utf-8", b"") == ","
+
+
+def test_has_more_lines_counts_like_text_mode(tmp_path):
+    """Conteo de líneas por bytes: \\n, \\r\\n y \\r, con o sin salto final."""
+    for sep in ("\n", "\r\n", "\r"):
+        for trailing in ("", sep):
+            path = tmp_path / "lines.csv"
+            path.write_bytes((sep.join(["a,b"] * 5) + trailing).encode())
+            assert DataLoader._has_more_lines(str(path), 4)
+            assert not DataLoader._has_more_lines(str(path), 5)
+
+
+def test_detect_encoding_fast_paths():
+    """ASCII, BOM y UTF-8 válido se resuelven sin chardet, con los mismos nombres."""
+    loader = DataLoader()
+    assert loader._detect_encoding("", b"a,b\n1,2\n") == "latin-1"
+    assert loader._detect_encoding("", "﻿a,b\n".encode("utf-8")) == "UTF-8-SIG"
+    assert loader._detect_encoding("", "niño,café\n".encode("utf-8") * 30) == "utf-8"
+
+
+def test_load_reads_file_head_once(tmp_path, monkeypatch):
+    """Las detecciones comparten un solo prefijo; un archivo pequeño se lee una sola vez del disco."""
+    path = tmp_path / "small.csv"
+    path.write_text("a;b\n1;x\n2;y\n", encoding="utf-8")
+    disk_reads, csv_sources = [], []
+    head = DataLoader._head
+
+    def counting_head(file_path, n, raw):
+        if raw is None:
+            disk_reads.append(n)
+        return head(file_path, n, raw)
+
+    read_csv = pd.read_csv
+
+    def recording_read_csv(source, **kwargs):
+        csv_sources.append(source)
+        return read_csv(source, **kwargs)
+
+    monkeypatch.setattr(DataLoader, "_head", staticmethod(counting_head))
+    monkeypatch.setattr(pd, "read_csv", recording_read_csv)
+    df_raw, df, meta = DataLoader().load(str(path))
+
+    assert len(disk_reads) == 1
+    assert meta["delimiter"] == repr(";")
+    assert len(csv_sources) == 2 and not any(isinstance(s, str) for s in csv_sources)
+    assert df["b"].tolist() == ["x", "y"]
@@ -0,0 +1,33 @@
+"""Tests para checks/temporal_completeness_checks.py"""
+
+import numpy as np
+import pandas as pd
+
+from checks.temporal_completeness_checks import run_temporal_completeness_checks
+from models.semantic_type import SemanticType
+
+
+def _df_with_degraded_month():
+    np.random.seed(3)
+    n = 720
+    df = pd.DataFrame({
+        "fecha": pd.date_range("2020-01-01", periods=n, freq="D"),
+        "a": np.random.normal(10, 1, n),
+        "b": np.random.normal(5, 1, n),
+    })
+    # Marzo 2021: captura degradada en todas las columnas
+    degraded = (df["fecha"] >= "2021-03-01") & (df["fecha"] < "2021-04-01")
+    df.loc[degraded, ["a", "b"]] = np.nan
+    return df
+
+
+def test_temporal_completeness_detects_degraded_period():
+    df = _df_with_degraded_month()
+    types = {"fecha": SemanticType.DATE, "a": SemanticType.NUMERIC_CONTINUOUS,
+             "b": SemanticType.NUMERIC_CONTINUOUS}
+    results = run_temporal_completeness_checks(df, df.astype(str), types)
+    completeness = [r for r in results if r.check_id == "TEMPORAL_COMPLETENESS"]
+    assert len(completeness) == 1
+    assert completeness[0].metadata["worst_period"] == "2021-03-31"
+    assert completeness[0].value == 1.0
+    assert {r.column for r in results if r.check_id == "TEMPORAL_NULL_CONCENTRATION"} == {"a", "b"}
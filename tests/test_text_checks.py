@@ -0,0 +1,25 @@
+"""Tests para checks/text_checks.py"""
+
+import numpy as np
+import pandas as pd
+from checks.text_checks import check_email_format, check_null_like_strings
+
+
+def test_email_format_invalid():
+    s = pd.Series(["a@b.com", "x@y.org", "malo@", "sin-arroba", ""], name="col")
+    result = check_email_format(s, s, {})
+    assert not result.passed
+    assert result.affected_count == 2
+
+
+def test_email_format_ignores_real_nulls():
+    s = pd.Series(["a@b.com", np.nan, None, "x@y.org"], name="col")
+    result = check_email_format(s, s, {})
+    assert result.passed
+
+
+def test_null_like_strings_low_cardinality():
+    s = pd.Series(["ok"] * 90 + ["N/A"] * 5 + ["null"] * 5, name="col")
+    result = check_null_like_strings(s, s, {})
+    assert result.affected_count == 10
+    assert sorted(result.sample_values) == ["N/A", "null"]
@@ -0,0 +1,67 @@
+"""Tests para checks/timeseries_checks.py"""
+
+import numpy as np
+import pandas as pd
+
+from checks.timeseries_checks import (
+    run_timeseries_checks, _column_timeseries_checks, _batched_acf, _changepoint_cusum,
+)
+from models.semantic_type import SemanticType
+
+
+def _ts_df(n=200, n_cols=5):
+    np.random.seed(7)
+    df = pd.DataFrame({"fecha": pd.date_range("2021-01-01", periods=n, freq="D")})
+    for i in range(n_cols):
+        df[f"x{i}"] = np.cumsum(np.random.normal(0, 1, n)) + np.linspace(0, 5 * i, n)
+    return df.sample(frac=1, random_state=1).reset_index(drop=True)
+
+
+def test_batched_acf_matches_single_column():
+    np.random.seed(0)
+    M = np.cumsum(np.random.normal(size=(120, 3)), axis=0)
+    batched = _batched_acf(M, 20)
+    for j in range(M.shape[1]):
+        single = _batched_acf(M[:, j:j + 1], 20)[:, 0]
+        assert np.allclose(batched[:, j], single)
+    assert np.allclose(batched[0], 1.0)
+
+
+def test_batched_path_matches_per_column():
+    df = _ts_df()
+    types = {"fecha": SemanticType.DATE}
+    types.update({c: SemanticType.NUMERIC_CONTINUOUS for c in df.columns if c != "fecha"})
+    batched = run_timeseries_checks(df, df.astype(str), types)
+    assert any(r.check_id == "CHANGEPOINT_CUSUM" for r in batched)
+
+    per_column = []
+    for col in df.columns[1:]:
+        per_column.extend(_column_timeseries_checks(df, df["fecha"], col))
+    assert [(r.check_id, r.column, r.value) for r in batched] == \
+           [(r.check_id, r.column, r.value) for r in per_column]
+
+
+def test_changepoint_means_from_prefix_sums():
+    s = np.concatenate([np.full(60, 1.0), np.full(40, 5.0)]) + np.random.RandomState(3).normal(0, 0.1, 100)
+    [r] = _changepoint_cusum(s, "x")
+    k = r.metadata["changepoint_index"]
+    assert r.metadata["mean_before"] == round(float(np.mean(s[:k + 1])), 4)
+    assert r.metadata["mean_after"] == round(float(np.mean(s[k + 1:])), 4)
+
+
+def test_repeated_dates_keep_sort_values_order():
+    # Con fechas repetidas el orden entre empates cambia la ACF: ambos caminos usan el de sort_values
+    rng = np.random.RandomState(5)
+    n = 300
+    df = pd.DataFrame({"fecha": pd.date_range("2021-01-01", periods=60, freq="D").repeat(5)[rng.permutation(n)],
+                       "x": rng.normal(0, 1, n) + np.repeat(np.sin(np.arange(60) / 3), 5)})
+    df["y"] = df["x"].where(np.arange(n) != 0)  # un nulo: camino por columna
+    types = {"fecha": SemanticType.DATE, "x": SemanticType.NUMERIC_CONTINUOUS,
+             "y": SemanticType.NUMERIC_CONTINUOUS}
+    results = {(r.check_id, r.column): r for r in run_timeseries_checks(df, df.astype(str), types)}
+
+    for col in ("x", "y"):
+        ordered = df[["fecha", col]].dropna().sort_values("fecha")[col].to_numpy()
+        expected = _batched_acf(ordered[:, None], 20)[:, 0]
+        acf_values = results[("AUTOCORRELATION", col)].metadata["acf_values"]
+        assert acf_values == [round(float(v), 4) for v in expected]
@@ -0,0 +1,32 @@
+"""Tests para utils/unique_values.py"""
+
+import pandas as pd
+
+from utils.unique_values import UniqueValues, apply_via_categories, CARDINALITY_PROBE_ROWS
+
+
+def test_apply_via_categories_matches_direct():
+    s = pd.Series(["a@b.com", "malo", "x@y.org", "malo"] * 50)
+    pred = lambda v: v.str.contains("@")
+    via_cats = apply_via_categories(s, pred)
+    assert via_cats.tolist() == pred(s).tolist()
+    assert via_cats.index.equals(s.index)
+
+
+def test_unique_values_subset_reuses_factorization():
+    s = pd.Series(["a@b.com", "N/A", "malo", "x@y.org"] * 50)
+    values = UniqueValues(s)
+    assert values.codes is not None
+    keep = s != "N/A"
+    sub = values.subset(keep)
+    assert sub.codes is not None and sub.uniques is values.uniques
+    pred = lambda v: v.str.contains("@")
+    assert sub.apply(pred).tolist() == pred(s[keep]).tolist()
+    assert sub.apply(pred).index.equals(s[keep].index)
+
+
+def test_unique_values_high_cardinality_skips_factorize():
+    s = pd.Series([f"v{i}" for i in range(CARDINALITY_PROBE_ROWS * 2)])
+    values = UniqueValues(s)
+    assert values.codes is None
+    assert values.subset(s != "v1").apply(lambda v: v.str.len()).sum() == s.str.len().sum() - 2
@@ -5,7 +5,9 @@ import numpy as np
 from checks.universal_checks import (
     check_null_rate, check_duplicate_rows, check_whitespace_issues,
     check_constant_column, check_near_constant,
+    check_null_rate_batch, check_constant_column_batch,
 )
+from models.semantic_type import SemanticType
 
 
 def test_null_rate_clean():
@@ -62,3 +64,57 @@ def test_near_constant_balanced():
     s = pd.Series(["A"] * 50 + ["B"] * 50, name="col")
     result = check_near_constant(s, s, {})
     assert result.passed
+
+
+def test_null_rate_numeric_fast_path():
+    from models.semantic_type import SemanticType
+    s_raw = pd.Series(["1", "", "3", "nan", "5"], name="col")
+    s_typed = pd.to_numeric(s_raw, errors="coerce")
+    meta = {"_semantic_type": SemanticType.NUMERIC_CONTINUOUS}
+    fast = check_null_rate(s_raw, s_typed, meta)
+    slow = check_null_rate(s_raw, s_typed, {})
+    assert fast.affected_count == slow.affected_count == 2
+
+
+def test_batch_checks_match_per_column():
+    df = pd.DataFrame({
+        "a": [1.0, np.nan, 3.0, np.nan],
+        "b": [7, 7, 7, 7],
+        "c": ["x", "N/A", "y", "x"],
+    })
+    df_raw = df.astype(str)
+    for sem_type in (SemanticType.NUMERIC_CONTINUOUS, SemanticType.CATEGORICAL):
+        meta = {"_semantic_type": sem_type}
+        for batch, single in ((check_null_rate_batch, check_null_rate),
+                              (check_constant_column_batch, check_constant_column)):
+            results = batch(df_raw, df, meta)
+            for col in df.columns:
+                assert results[col].to_dict() == single(df_raw[col], df[col], meta).to_dict()
+        # La columna de texto pasa por el escaneo de null-like aunque el bloque sea tipado
+        assert check_null_rate_batch(df_raw, df, meta)["c"].affected_count == 1
+
+
+def test_null_rate_text_date_column_scans_null_like():
+    # Con pandas >= 3 el texto es dtype str (no object): no debe tomar el atajo de isna()
+    values = ["2024-01-01", "-", "2024-01-03", "desconocido", "2024-01-05"] * 2
+    s = pd.Series(values, name="fecha", dtype="str")
+    meta = {"_semantic_type": SemanticType.DATE}
+    for result in (check_null_rate(s, s, meta),
+                   check_null_rate_batch(s.to_frame(), s.to_frame(), meta)["fecha"]):
+        assert result.affected_count == 4
+        assert result.severity == "HIGH"
+
+
+def test_whitespace_issues_reported_for_padded_numeric_fields():
+    # pandas parsea " 10.5" como número: el padding solo se ve en el texto crudo
+    from core.check_registry import CheckRegistry
+
+    raw = pd.Series([" 10.5", "20.1 ", " 3.0"] + [f"{i}.5" for i in range(9)], name="monto")
+    typed = pd.to_numeric(raw)
+    assert typed.dtype.kind == "f"
+    result = check_whitespace_issues(raw, typed, {"_semantic_type": SemanticType.NUMERIC_CONTINUOUS})
+    assert not result.passed
+    assert result.affected_count == 3
+    for sem_type in (SemanticType.NUMERIC_CONTINUOUS, SemanticType.NUMERIC_DISCRETE):
+        ids = [c["check_id"] for c in CheckRegistry().get_checks_for_type(sem_type)]
+        assert "WHITESPACE_ISSUES" in ids
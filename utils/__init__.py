@@ -0,0 +1 @@
+from .unique_values import UniqueValues, apply_via_categories
@@ -0,0 +1,60 @@
+"""
+Evaluación de predicados vectorizados de pandas por valor único de una serie.
+
+Columnas de texto con pocos valores distintos: el predicado (regex, len, isin...) se calcula
+una vez por único y se propaga a cada fila con los códigos de pd.factorize.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Con menos de 1 único por cada N filas, los predicados se evalúan sobre los únicos
+CATEGORY_GATE_RATIO = 8
+# Filas iniciales con las que se estima la cardinalidad antes de factorizar la serie completa
+CARDINALITY_PROBE_ROWS = 4096
+
+
+class UniqueValues:
+    """Serie factorizada una sola vez para evaluar varios predicados vectorizados por valor único.
+
+    Con mucha cardinalidad (estimada sobre las primeras CARDINALITY_PROBE_ROWS filas, o
+    confirmada al factorizar) no se factoriza y los predicados se evalúan sobre la serie.
+    """
+
+    def __init__(self, series: pd.Series, codes=None, uniques=None, direct=False):
+        self.series = series
+        self.codes, self.uniques = codes, uniques
+        if codes is None and not direct and not self._looks_high_cardinality(series):
+            codes, uniques = pd.factorize(series, use_na_sentinel=False)
+            if len(uniques) * CATEGORY_GATE_RATIO < len(series):
+                self.codes, self.uniques = codes, pd.Series(uniques)
+
+    @staticmethod
+    def _looks_high_cardinality(series: pd.Series) -> bool:
+        if len(series) <= CARDINALITY_PROBE_ROWS:
+            return False
+        head = series.iloc[:CARDINALITY_PROBE_ROWS]
+        return head.nunique(dropna=False) * CATEGORY_GATE_RATIO >= len(head)
+
+    def apply(self, predicate) -> pd.Series:
+        """predicate(serie) -> array/serie alineada, calculado por único y propagado a cada fila."""
+        if self.codes is None:
+            return pd.Series(np.asarray(predicate(self.series)), index=self.series.index)
+        per_unique = np.asarray(predicate(self.uniques))
+        return pd.Series(per_unique[self.codes], index=self.series.index)
+
+    def subset(self, mask) -> "UniqueValues":
+        """Filas de mask, reutilizando la factorización (los únicos sobrantes no afectan)."""
+        mask = np.asarray(mask, dtype=bool)
+        if self.codes is None:
+            return UniqueValues(self.series[mask], direct=True)
+        return UniqueValues(self.series[mask], codes=self.codes[mask], uniques=self.uniques)
+
+
+def apply_via_categories(series: pd.Series, predicate) -> pd.Series:
+    """Evalúa un predicado vectorizado sobre los valores únicos y lo propaga a cada fila.
+
+    Si la columna tiene mucha cardinalidad, se evalúa directamente sobre la serie.
+    """
+    return UniqueValues(series).apply(predicate)